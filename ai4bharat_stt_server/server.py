@@ -5,7 +5,7 @@ import base64
 import argparse
 import torch
 import numpy as np
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from pydantic import BaseModel
 import uvicorn
 from transformers import AutoModel
@@ -69,18 +69,27 @@ async def load_model():
     print("Model ready")
 
 
-@app.post("/transcribe", response_model=TranscribeResponse)
-async def transcribe(request: TranscribeRequest):
-    audio_bytes = base64.b64decode(request.audio_b64)
+async def transcribe_pcm(audio_bytes: bytes, language_id: str) -> TranscribeResponse:
     audio_np = np.frombuffer(audio_bytes, dtype=np.int16).astype(np.float32) / 32768.0
     
     text = await asyncio.get_event_loop().run_in_executor(
-        None, transcribe_sync, audio_np, request.language_id
+        None, transcribe_sync, audio_np, language_id
     )
     
     return TranscribeResponse(text=text)
 
 
+@app.post("/transcribe", response_model=TranscribeResponse)
+async def transcribe(request: TranscribeRequest):
+    return await transcribe_pcm(base64.b64decode(request.audio_b64), request.language_id)
+
+
+@app.post("/transcribe/raw", response_model=TranscribeResponse)
+async def transcribe_raw(request: Request, language_id: str = "hi"):
+    """Raw 16 kHz PCM16 body (application/octet-stream), no base64/JSON wrapping."""
+    return await transcribe_pcm(await request.body(), language_id)
+
+
 @app.get("/health")
 async def health():
     return {"status": "healthy", "device": str(device)}
@@ -3,6 +3,7 @@ import base64
 import json
 import os
 import socket
+import struct
 from contextlib import asynccontextmanager
 from threading import Thread, Event
 from typing import AsyncGenerator
@@ -39,6 +40,11 @@ class ModelState:
 
 state = ModelState()
 
+# Binary stream framing: a JSON header line with the sample rate, then
+# little-endian u32 length-prefixed PCM16 chunks, ended by a zero length.
+BINARY_MEDIA_TYPE = "application/octet-stream"
+FRAME_HEADER = struct.Struct("<I")
+
 
 async def load_model():
     state.device = "cuda:0" if torch.cuda.is_available() else "cpu"
@@ -87,6 +93,7 @@ async def generate_audio_chunks(
     description: str,
     speaker: str,
     play_steps_in_s: float,
+    binary: bool = False,
 ) -> AsyncGenerator[bytes, None]:
     full_description = f"{speaker}'s voice. {description}"
     play_steps = int(state.frame_rate * play_steps_in_s)
@@ -123,6 +130,9 @@ async def generate_audio_chunks(
     client_disconnected = False
 
     try:
+        if binary:
+            yield json.dumps({"sample_rate": state.sample_rate}) + "\n"
+
         for new_audio in streamer:
             if new_audio.shape[0] == 0:
                 break
@@ -131,17 +141,24 @@ async def generate_audio_chunks(
                 client_disconnected = True
                 break
 
-            audio_int16 = (np.clip(new_audio, -1.0, 1.0) * 32767).astype(np.int16)
+            audio_bytes = (np.clip(new_audio, -1.0, 1.0) * 32767).astype(np.int16).tobytes()
+            logger.info(f"Audio chunk going out: {len(audio_bytes)} bytes")
+            if binary:
+                yield FRAME_HEADER.pack(len(audio_bytes)) + audio_bytes
+                continue
+
             chunk_data = {
-                "audio": base64.b64encode(audio_int16.tobytes()).decode("utf-8"),
+                "audio": base64.b64encode(audio_bytes).decode("utf-8"),
                 "sample_rate": state.sample_rate,
                 "samples": new_audio.shape[0],
             }
-            logger.info(f"Audio chunk going out: {len(audio_int16.tobytes())} bytes")
             yield json.dumps(chunk_data) + "\n"
 
         if not client_disconnected:
-            yield json.dumps({"done": True}) + "\n"
+            if binary:
+                yield FRAME_HEADER.pack(0)
+            else:
+                yield json.dumps({"done": True}) + "\n"
 
     finally:
         generation_complete.wait()
@@ -160,6 +177,8 @@ async def stream_tts(request: Request, tts_request: TTSRequest):
     if not tts_request.text.strip():
         raise HTTPException(status_code=400, detail="Text cannot be empty")
 
+    binary = BINARY_MEDIA_TYPE in request.headers.get("accept", "")
+
     return StreamingResponse(
         generate_audio_chunks(
             request=request,
@@ -167,8 +186,9 @@ async def stream_tts(request: Request, tts_request: TTSRequest):
             description=tts_request.description,
             speaker=tts_request.speaker,
             play_steps_in_s=tts_request.play_steps_in_s,
+            binary=binary,
         ),
-        media_type="application/x-ndjson",
+        media_type=BINARY_MEDIA_TYPE if binary else "application/x-ndjson",
         headers={
             "Cache-Control": "no-cache",
             "X-Content-Type-Options": "nosniff",
@@ -12,7 +12,10 @@ from .services import (
     create_llm_service,
     create_stt_service,
     create_tts_service,
+    parse_service_specs,
+    reload_env,
     ServiceCreationError,
+    ServiceSpec,
 )
 
 __all__ = [
@@ -25,5 +28,8 @@ __all__ = [
     "create_llm_service",
     "create_stt_service",
     "create_tts_service",
+    "parse_service_specs",
+    "reload_env",
     "ServiceCreationError",
+    "ServiceSpec",
 ]
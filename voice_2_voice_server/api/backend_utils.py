@@ -1,10 +1,13 @@
 """Backend API utility functions for voice bot integration."""
 
+import asyncio
 import os
 import time
 import traceback
+from collections import OrderedDict
 from datetime import datetime
-from typing import Optional, Dict, Any
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Mapping, Tuple
 
 from loguru import logger
 import requests
@@ -51,13 +54,15 @@ async def fetch_agent_config_from_backend(agent_id: str) -> dict:
     
     try:
         logger.info(f"📥 Fetching agent config from backend: {agent_id}")
-        response = requests.get(api_endpoint, headers=headers, timeout=10)
+        response = await asyncio.to_thread(
+            requests.get, api_endpoint, headers=headers, timeout=10
+        )
         response.raise_for_status()
         
         agent_data = response.json()
         # Extract agent_config from response
         agent_config = agent_data.get("agent_config", {})
-        logger.info(f"📥 Agent config: {agent_config}")
+        logger.opt(lazy=True).info("📥 Agent config: {}", lambda: agent_config)
         
         # Add other fields that might be needed
         if "org_id" in agent_data:
@@ -80,6 +85,55 @@ async def fetch_agent_config_from_backend(agent_id: str) -> dict:
         return None
 
 
+# Agent configs are fetched by the /answer webhook and again moments later by
+# the WebSocket endpoint, so a short-lived cache avoids the second round trip.
+AGENT_CONFIG_CACHE_TTL_SECS = 60.0
+AGENT_CONFIG_CACHE_SIZE = 256
+_agent_config_cache: "OrderedDict[str, Tuple[float, Mapping[str, Any]]]" = OrderedDict()
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively wrap dicts in read-only views and lists in tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+async def get_agent_config(agent_id: str) -> Optional[Mapping[str, Any]]:
+    """
+    Get agent configuration, served from an in-process cache when fresh.
+    
+    The returned mapping is shared by every caller for the same agent, so
+    it is frozen all the way down: nested config blocks are read-only
+    mappings and lists are tuples. Copy what needs changing instead.
+    
+    Args:
+        agent_id: Agent ID to fetch config for
+        
+    Returns:
+        Read-only agent configuration mapping, or None if the fetch failed
+    """
+    now = time.monotonic()
+    cached = _agent_config_cache.get(agent_id)
+    if cached is not None:
+        if cached[0] > now:
+            _agent_config_cache.move_to_end(agent_id)
+            return cached[1]
+        del _agent_config_cache[agent_id]
+
+    agent_config = await fetch_agent_config_from_backend(agent_id)
+    if agent_config is None:
+        return None
+
+    frozen = _freeze(agent_config)
+    _agent_config_cache[agent_id] = (now + AGENT_CONFIG_CACHE_TTL_SECS, frozen)
+    if len(_agent_config_cache) > AGENT_CONFIG_CACHE_SIZE:
+        _agent_config_cache.popitem(last=False)
+    return frozen
+
+
 async def create_meeting_in_backend(payload) :
     """Create a meeting record in the backend when call starts."""
     backend_url = _get_backend_url()
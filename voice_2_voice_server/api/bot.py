@@ -21,7 +21,7 @@ from pipecat.processors.transcript_processor import TranscriptProcessor
 from pipecat.audio.vad.silero import SileroVADAnalyzer
 from pipecat.audio.vad.vad_analyzer import VADParams
 from pipecat.utils.text.base_text_aggregator import BaseTextAggregator, Aggregation, AggregationType
-from typing import Any
+from typing import Any, Mapping
 from pipecat.transports.websocket.fastapi import (
     FastAPIWebsocketParams,
     FastAPIWebsocketTransport,
@@ -32,6 +32,7 @@ from .services import (
     create_llm_service,
     create_stt_service,
     create_tts_service,
+    parse_service_specs,
     ServiceCreationError,
 )
 # Import the new filter
@@ -72,6 +73,13 @@ def _get_sample_rate() -> int:
     return int(os.getenv("SAMPLE_RATE", "8000"))
 
 
+def _json_default(value: Any) -> Any:
+    """Serialize the frozen agent config (read-only mappings) for logging."""
+    if isinstance(value, Mapping):
+        return dict(value)
+    return str(value)
+
+
 class FastPunctuationAggregator(BaseTextAggregator):
     """Fast aggregator that sends text immediately on punctuation - no lookahead/NLTK."""
     
@@ -130,7 +138,7 @@ def patch_immediate_first_chunk(transport):
 
 async def run_bot(
     transport: FastAPIWebsocketTransport,
-    agent_config: dict,
+    agent_config: Mapping[str, Any],
     audiobuffer: AudioBufferProcessor,
     transcript: TranscriptProcessor,
     handle_sigint: bool = False,
@@ -148,23 +156,17 @@ async def run_bot(
     start_time = time.monotonic()
     sample_rate = _get_sample_rate()
     
-    logger.debug(f"Agent config: {json.dumps(agent_config, indent=2, default=str)}")
+    logger.opt(lazy=True).debug(
+        "Agent config: {}", lambda: json.dumps(agent_config, indent=2, default=_json_default)
+    )
     
     try:
-        llm_config = agent_config.get("llm_model", {})
-        stt_config = agent_config.get("stt_model", {})
-        tts_config = agent_config.get("tts_model", {})
-        
-        language = agent_config.get("language")
-        if language:
-            if not stt_config.get("language"):
-                stt_config["language"] = language
-            if not tts_config.get("language"):
-                tts_config["language"] = language
-     
-        llm = create_llm_service(llm_config)
-        stt = create_stt_service(stt_config, sample_rate, vad_analyzer=vad_analyzer)
-        tts = create_tts_service(tts_config, sample_rate)
+        # Parsed once per shared agent config; STT/TTS default to the agent language
+        specs = parse_service_specs(agent_config)
+
+        llm = create_llm_service(specs.llm)
+        stt = create_stt_service(specs.stt, sample_rate, vad_analyzer=vad_analyzer)
+        tts = create_tts_service(specs.tts, sample_rate)
         
         # Use fast aggregator (no lookahead/NLTK) for lower latency
         tts._aggregate_sentences = True
@@ -237,7 +239,7 @@ async def bot(
     stream_sid: str,
     call_sid: str,
     agent_type: str,
-    agent_config: dict
+    agent_config: Mapping[str, Any]
 ) -> None:
     """Main bot entry point - sets up transport and runs the pipeline."""
     sample_rate = _get_sample_rate()
@@ -261,10 +263,7 @@ async def bot(
     serializer = VobizFrameSerializer(
         stream_sid=stream_sid,
         call_sid=call_sid,
-        params=VobizFrameSerializer.InputParams(
-            vobiz_sample_rate=sample_rate,
-            sample_rate=sample_rate
-        )
+        params=VobizFrameSerializer.InputParams.for_sample_rate(sample_rate)
     )
     
     vad_analyzer = SileroVADAnalyzer(
@@ -354,6 +353,14 @@ async def bot(
         else:
             logger.warning(f"No audio data to save for {call_sid}")
 
+        # Assemble any lines written through storage.append_transcript; a no-op
+        # unless something appended for this call. The in-memory transcript
+        # below, when present, is complete and is written last.
+        try:
+            await storage.finalize_transcript(call_sid)
+        except Exception as e:
+            logger.error(f" Failed to finalize appended transcript: {e}")
+
         if call_data["transcript_lines"]:
             try:
                 await storage.save_transcript_from_lines(call_sid, call_data["transcript_lines"])
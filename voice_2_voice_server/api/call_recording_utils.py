@@ -4,7 +4,7 @@ import os
 import time
 import traceback
 from datetime import datetime
-from typing import Optional
+from typing import Any, Mapping, Optional
 
 from loguru import logger
 import requests
@@ -14,7 +14,7 @@ from storage.minio_client import MinIOStorage
 async def submit_call_recording(
     call_sid: str,
     agent_type: str,
-    agent_config: dict,
+    agent_config: Mapping[str, Any],
     storage: MinIOStorage,
     call_start_time: float
 ) -> None:
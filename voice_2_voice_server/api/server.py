@@ -1,13 +1,16 @@
 """FastAPI server for Vobiz telephony integration with optimized TCP settings."""
 
+import asyncio
 import os
 import socket
-import json
+import sys
 import traceback
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
+from urllib.parse import parse_qsl
 
+import orjson
 from loguru import logger
 from dotenv import load_dotenv
 from fastapi import FastAPI, WebSocket, Request, HTTPException
@@ -15,12 +18,14 @@ from fastapi.responses import JSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .bot import bot
 from .backend_utils import (
     create_meeting_in_backend,
     update_meeting_end_time,
-    fetch_agent_config_from_backend,
+    get_agent_config,
 )
 
 
@@ -28,37 +33,103 @@ load_dotenv()
 
 # Constants
 AGENT_CONFIGS_DIR = Path("agent_configs")
+# Same field cap request.form() applies (Starlette's max_fields default)
+WEBHOOK_MAX_FIELDS = 1000
+
+# Bounds concurrent Vobiz API calls so a slow upstream cannot exhaust the
+# default thread pool
+VOBIZ_MAX_CONCURRENT_CALLS = 16
+_vobiz_semaphore = asyncio.Semaphore(VOBIZ_MAX_CONCURRENT_CALLS)
+
+
+def _create_vobiz_session() -> requests.Session:
+    """Create a pooled session so outbound calls reuse TLS connections.
+
+    Retries only cover connection errors and idempotent methods; the call
+    creation POST itself is never replayed on a 5xx.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=64,
+        max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_vobiz_session = _create_vobiz_session()
 
 
 # === TCP_NODELAY WebSocket Protocol ===
 
+# Linux-only socket options; not exposed by the socket module on every platform
+TCP_QUICKACK = getattr(socket, "TCP_QUICKACK", 12)
+SO_BUSY_POLL = getattr(socket, "SO_BUSY_POLL", 46)
+
+# Large enough for audio bursts, small enough to shed stale audio
+SOCKET_BUFFER_BYTES = 64 * 1024
+BUSY_POLL_MICROS = 50
+
+
+def _try_setsockopt(sock: socket.socket, level: int, option: int, value: int, name: str) -> None:
+    """Set a best-effort socket option, logging instead of raising on failure."""
+    try:
+        sock.setsockopt(level, option, value)
+    except OSError as e:
+        logger.debug(f"Could not set {name}: {e}")
+
+
+def _tune_socket(sock: socket.socket) -> None:
+    """Apply low-latency socket options to an accepted connection."""
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    _try_setsockopt(sock, socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_BYTES, "SO_SNDBUF")
+    _try_setsockopt(sock, socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_BYTES, "SO_RCVBUF")
+    if sys.platform.startswith("linux"):
+        # Suppress delayed ACKs on the audio stream
+        _try_setsockopt(sock, socket.IPPROTO_TCP, TCP_QUICKACK, 1, "TCP_QUICKACK")
+        # Busy-poll the NIC queue for sub-ms wakeups
+        _try_setsockopt(sock, socket.SOL_SOCKET, SO_BUSY_POLL, BUSY_POLL_MICROS, "SO_BUSY_POLL")
+
+
 def create_nodelay_websocket_protocol():
     """Create a WebSocket protocol class with TCP_NODELAY enabled.
     
     This disables Nagle's algorithm for lower latency on small packets,
     which is critical for real-time voice applications.
+
+    Prefers uvicorn's sans-I/O ``websockets`` implementation, which avoids
+    the per-frame double buffering of the legacy asyncio implementation,
+    and falls back to the legacy protocol on older uvicorn releases.
     """
     try:
-        from uvicorn.protocols.websockets.websockets_impl import WebSocketProtocol
-
-        class NoDelayWebSocketProtocol(WebSocketProtocol):
-            def connection_made(self, transport):
-                # Set TCP_NODELAY before calling parent
-                try:
-                    sock = transport.get_extra_info("socket")
-                    if sock is not None:
-                        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
-                        logger.debug("TCP_NODELAY enabled on WebSocket connection")
-                except Exception as e:
-                    logger.warning(f"Failed to set TCP_NODELAY: {e}")
-                
-                super().connection_made(transport)
-
-        return NoDelayWebSocketProtocol
-    
+        from uvicorn.protocols.websockets.websockets_sansio_impl import (
+            WebSocketsSansIOProtocol as BaseProtocol,
+        )
     except ImportError:
-        logger.warning("Could not import WebSocketProtocol from uvicorn, TCP_NODELAY not available")
-        return None
+        try:
+            from uvicorn.protocols.websockets.websockets_impl import (
+                WebSocketProtocol as BaseProtocol,
+            )
+        except ImportError:
+            logger.warning("Could not import WebSocketProtocol from uvicorn, TCP_NODELAY not available")
+            return None
+
+    class NoDelayWebSocketProtocol(BaseProtocol):
+        def connection_made(self, transport):
+            # Set TCP_NODELAY before calling parent
+            try:
+                sock = transport.get_extra_info("socket")
+                if sock is not None:
+                    _tune_socket(sock)
+                    logger.debug("TCP_NODELAY enabled on WebSocket connection")
+            except Exception as e:
+                logger.warning(f"Failed to set TCP_NODELAY: {e}")
+            
+            super().connection_made(transport)
+
+    return NoDelayWebSocketProtocol
 
 
 # === Pydantic Models ===
@@ -81,7 +152,7 @@ def _get_env_or_raise(key: str) -> str:
     return value
 
 
-def make_outbound_call_vobiz(
+async def make_outbound_call_vobiz(
     customer_number: str,
     agent_id: str,
     caller_id: Optional[str] = None,
@@ -124,7 +195,10 @@ def make_outbound_call_vobiz(
     logger.info(f"📞 Outbound call: {from_number} → {customer_number} (agent: {agent_id})")
     
     vobiz_api_url = f"{vobiz_api_base_url}/Account/{auth_id}/Call/"
-    response = requests.post(vobiz_api_url, json=payload, headers=headers, timeout=30)
+    async with _vobiz_semaphore:
+        response = await asyncio.to_thread(
+            _vobiz_session.post, vobiz_api_url, json=payload, headers=headers, timeout=30
+        )
     response.raise_for_status()
 
     result = response.json()
@@ -195,7 +269,7 @@ async def make_outbound_call(request: OutboundCallRequest):
         Call initiation result
     """
     try:
-        result = make_outbound_call_vobiz(
+        result = await make_outbound_call_vobiz(
             request.customer_number,
             request.agent_id,
             request.caller_id,
@@ -222,28 +296,26 @@ async def make_outbound_call(request: OutboundCallRequest):
 async def log_meeting(agent_id: str, form_data_dict: dict):
     """Log meeting/call data to backend."""
     try:
-        agent_config = await fetch_agent_config_from_backend(agent_id)
+        agent_config = await get_agent_config(agent_id)
         agent_type = agent_config.get("agent_type")
         org_id = agent_config.get("org_id")
 
-        direction = form_data_dict.get("Direction", "outbound")
         is_busy = form_data_dict.get("HangupCause", "unknown") == "USER_BUSY"
-        start_time_utc = datetime.now(timezone.utc).isoformat()
-        end_time_utc = start_time_utc if is_busy else ""
+        now = datetime.now(timezone.utc).isoformat()
 
         meeting_data = {
             "meeting_id": form_data_dict.get("CallUUID", "unknown"),
             "agent_type": agent_type,
             "org_id": org_id,
-            "start_time_utc": start_time_utc,
-            "end_time_utc": end_time_utc,
-            "inbound": direction == "inbound",
+            "start_time_utc": now,
+            "end_time_utc": now if is_busy else "",
+            "inbound": form_data_dict.get("Direction", "outbound") == "inbound",
             "from_number": form_data_dict.get("From", "unknown"),
             "to_number": form_data_dict.get("To", "unknown"),
-            "created_at": datetime.now(timezone.utc).isoformat(),
+            "created_at": now,
             "call_busy": is_busy,
         }
-        logger.info(f"Meeting data: {meeting_data}")
+        logger.opt(lazy=True).info("Meeting data: {}", lambda: meeting_data)
         await create_meeting_in_backend(meeting_data)
         return {"status": "success"}
     except Exception as e:
@@ -251,6 +323,25 @@ async def log_meeting(agent_id: str, form_data_dict: dict):
         return {"status": "error", "message": str(e)}
 
 
+async def _read_webhook_params(request: Request) -> dict:
+    """Read Vobiz webhook parameters without building a FormData object.
+
+    Vobiz posts a small urlencoded body, so it is parsed directly; any
+    other body (e.g. multipart) goes through request.form() as before.
+    GET callbacks carry the same fields in the query string.
+    """
+    if request.method == "GET":
+        return dict(request.query_params)
+    content_type = request.headers.get("content-type", "").split(";", 1)[0].strip().lower()
+    if content_type != "application/x-www-form-urlencoded":
+        return dict(await request.form())
+    body = await request.body()
+    try:
+        return dict(parse_qsl(body.decode("utf-8", "replace"), max_num_fields=WEBHOOK_MAX_FIELDS))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @app.api_route("/answer", methods=["GET", "POST"])
 async def vobiz_answer_webhook(request: Request):
     """Vobiz answer webhook - returns XML with WebSocket URL.
@@ -259,8 +350,7 @@ async def vobiz_answer_webhook(request: Request):
     It returns XML instructing Vobiz to connect to our WebSocket.
     """
     agent_id = request.query_params.get("agent_id")
-    form_data = await request.form()
-    form_data_dict = dict(form_data)
+    form_data_dict = await _read_webhook_params(request)
     event = form_data_dict.get("Event", "unknown")
     hangup_cause = form_data_dict.get("HangupCause", "USER_BUSY")
 
@@ -292,20 +382,23 @@ async def websocket_endpoint(websocket: WebSocket, agent_id: str):
 
     call_sid = None
     stream_sid = None
+    config_task = None
 
     try:
-        # Load agent configuration
-        agent_config = await fetch_agent_config_from_backend(agent_id)
-        agent_type = agent_config.get("agent_type")
+        # Load agent configuration while waiting for the start event
+        config_task = asyncio.create_task(get_agent_config(agent_id))
+
+        # Wait for start event with call metadata
+        first_message = await websocket.receive_text()
+        agent_config = await config_task
 
-        logger.info(f"📥 Agent config: {agent_config}")
+        logger.opt(lazy=True).info("📥 Agent config: {}", lambda: agent_config)
         if not agent_config:
             logger.error(f"❌ Failed to fetch agent config from backend: {agent_id}")
             return
+        agent_type = agent_config.get("agent_type")
 
-        # Wait for start event with call metadata
-        first_message = await websocket.receive_text()
-        data = json.loads(first_message)
+        data = orjson.loads(first_message)
 
         if data.get("event") != "start":
             logger.warning(f"⚠️ Expected 'start' event, got: {data.get('event')}")
@@ -316,7 +409,7 @@ async def websocket_endpoint(websocket: WebSocket, agent_id: str):
         stream_sid = start_info.get("streamSid") or start_info.get("streamId", "unknown")
 
         logger.info(f"📞 Call started: call_sid={call_sid}, stream_sid={stream_sid}")
-        logger.debug(f"📋 Start info: {start_info}")
+        logger.opt(lazy=True).debug("📋 Start info: {}", lambda: start_info)
 
         await bot(websocket, stream_sid, call_sid, agent_type, agent_config)
 
@@ -327,6 +420,8 @@ async def websocket_endpoint(websocket: WebSocket, agent_id: str):
         logger.error(f"❌ WebSocket error: {e}")
         logger.debug(traceback.format_exc())
     finally:
+        if config_task is not None and not config_task.done():
+            config_task.cancel()
         logger.info(f"🔌 WebSocket closed: call_sid={call_sid}")
 
 
@@ -340,6 +435,15 @@ def run_server(host: str = "0.0.0.0", port: int = 7860, log_level: str = "info")
     """
     import uvicorn
 
+    # Custom WebSocket protocol with TCP_NODELAY. uvicorn resolves `ws` when
+    # the config is loaded, so the class must be passed here rather than
+    # assigned to `ws_protocol_class` afterwards.
+    nodelay_protocol = create_nodelay_websocket_protocol()
+    if nodelay_protocol:
+        logger.info("✅ TCP_NODELAY enabled for WebSocket connections (Nagle's algorithm disabled)")
+    else:
+        logger.warning("⚠️ Could not enable TCP_NODELAY, latency may be affected")
+
     # Create config with optimized settings
     config = uvicorn.Config(
         app,
@@ -351,17 +455,9 @@ def run_server(host: str = "0.0.0.0", port: int = 7860, log_level: str = "info")
         # HTTP/1.1 settings
         http="auto",
         # WebSocket settings
-        ws="websockets",
+        ws=nodelay_protocol or "auto",
     )
 
-    # Set custom WebSocket protocol with TCP_NODELAY
-    nodelay_protocol = create_nodelay_websocket_protocol()
-    if nodelay_protocol:
-        config.ws_protocol_class = nodelay_protocol
-        logger.info("✅ TCP_NODELAY enabled for WebSocket connections (Nagle's algorithm disabled)")
-    else:
-        logger.warning("⚠️ Could not enable TCP_NODELAY, latency may be affected")
-
     server = uvicorn.Server(config)
     server.run()
 
@@ -1,34 +1,18 @@
 """Service factory functions for creating LLM, STT, and TTS services."""
 
 import os
-from typing import Any
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from importlib import import_module
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple, Union
 
 from loguru import logger
-from deepgram import LiveOptions
-
-# Pipecat services
-from pipecat.services.openai.llm import OpenAILLMService
-from pipecat.services.cartesia.tts import CartesiaTTSService
-from pipecat.services.deepgram.stt import DeepgramSTTService
-from pipecat.services.deepgram.tts import DeepgramTTSService
-from pipecat.services.google.stt import GoogleSTTService
-from pipecat.services.google.tts import GoogleTTSService
-from pipecat.services.google.llm import GoogleLLMService
-from pipecat.services.openai.stt import OpenAISTTService
-from pipecat.services.openai.tts import OpenAITTSService
-from pipecat.services.sarvam.stt import SarvamSTTService
-from pipecat.services.sarvam.tts import SarvamTTSService
-from pipecat.processors.aggregators.llm_response import LLMUserAggregatorParams
-
-# Local services
-from services.kenpath_llm.llm import KenpathLLM
-from services.ai4bharat.tts import IndicParlerRESTTTSService
-from services.ai4bharat.stt import IndicConformerRESTSTTService
-from services.bhashini.stt import BhashiniSTTService
-from services.bhashini.tts import BhashiniTTSService
+
 from config import get_llm_model
-from config.stt_mappings import STT_LANGUAGE_MAP
-from config.tts_mappings import TTS_LANGUAGE_MAP
+from config.stt_mappings import STT_LANGUAGE_CODES
+from config.tts_mappings import TTS_LANGUAGE_CODES
 
 
 class ServiceCreationError(Exception):
@@ -37,83 +21,645 @@ class ServiceCreationError(Exception):
     pass
 
 
-def create_llm_service(llm_config: dict) -> Any:
-    """Create an LLM service based on configuration.
+@dataclass(frozen=True, slots=True)
+class ServiceSpec:
+    """Normalized view of one llm/stt/tts config block.
 
-    Args:
-        llm_config: LLM configuration dict with 'name' and optional 'args'
+    Attributes:
+        provider: Canonical provider key (e.g. "Deepgram"), or the raw name if unknown
+        language: Language display name, defaulting to the agent-level language
+        config: The raw config block (read-only)
+        args: The block's 'args' mapping (read-only)
+    """
 
-    Returns:
-        Configured LLM service instance
+    provider: Optional[str]
+    language: Optional[str]
+    config: Mapping[str, Any]
+    args: Mapping[str, Any]
 
-    Raises:
-        ServiceCreationError: If the LLM provider is unknown
+
+@dataclass(frozen=True, slots=True)
+class ServiceSpecs:
+    """Parsed service specs for one agent config."""
+
+    llm: ServiceSpec
+    stt: ServiceSpec
+    tts: ServiceSpec
+
+
+@lru_cache(maxsize=None)
+def _env(key: str, default: Optional[str] = None) -> Optional[str]:
+    """Read an environment variable once and memoize it.
+
+    Read lazily rather than at import so values from ``.env`` (loaded after
+    this module is imported) are still picked up.
     """
-    provider = llm_config.get("name") or llm_config.get("provider")
-    args = llm_config.get("args", {})
-    model = args.get("model") or llm_config.get("model")
-
-    # Normalize provider name
-    provider_map = {
-        "openai": "OpenAI",
-        "gemini": "Gemini",
-        "google": "Gemini",
-        "kenpath": "Kenpath",
-    }
-    provider = provider_map.get(provider.lower(), provider) if provider else provider
+    return os.getenv(key, default)
 
-    if provider == "OpenAI":
-        # Extract user aggregator params from config, with defaults
-        user_aggregator_params = LLMUserAggregatorParams(
-            aggregation_timeout=args.get("aggregation_timeout", 0.05)
-        )
 
-        resolved_model = get_llm_model(provider, model)
-        logger.info(f"OpenAI LLM: model={resolved_model}")
+@lru_cache(maxsize=None)
+def _keyed_service(module: str, class_name: str, *env_keys: str) -> Callable[..., Any]:
+    """Import a service class lazily and bind its process-wide API key.
 
-        service = OpenAILLMService(
-            api_key=os.getenv("OPENAI_API_KEY"),
-            model=resolved_model,
+    The first of ``env_keys`` that is set supplies the key. The bound
+    constructor is cached until ``reload_env()``.
+
+    Raises:
+        ServiceCreationError: If none of ``env_keys`` is set
+    """
+    api_key = next(filter(None, map(_env, env_keys)), None)
+    if not api_key:
+        raise ServiceCreationError(
+            f"Missing API key for {class_name}: set {' or '.join(env_keys)}"
         )
+    return partial(getattr(import_module(module), class_name), api_key=api_key)
+
+
+def reload_env() -> None:
+    """Forget memoized environment values, e.g. after rotating API keys."""
+    _env.cache_clear()
+    _keyed_service.cache_clear()
+
+
+# Map lower-case provider names from agent configs to canonical provider keys
+_LLM_PROVIDER_ALIASES = MappingProxyType({
+    "openai": "OpenAI",
+    "gemini": "Gemini",
+    "google": "Gemini",
+    "kenpath": "Kenpath",
+})
+
+_STT_PROVIDER_ALIASES = MappingProxyType({
+    "deepgram": "Deepgram",
+    "google": "Google",
+    "openai": "OpenAI",
+    "sarvam": "Sarvam",
+    "ai4bharat": "AI4Bharat",
+    "bhashini": "Bhashini",
+})
+
+_TTS_PROVIDER_ALIASES = MappingProxyType({
+    "cartesia": "Cartesia",
+    "google": "Google",
+    "openai": "OpenAI",
+    "sarvam": "Sarvam",
+    "ai4bharat": "AI4Bharat",
+    "bhashini": "Bhashini",
+    "deepgram": "Deepgram",
+})
+
+# Canonical provider keys, which need no normalization
+_CANONICAL_LLM_PROVIDERS = frozenset(_LLM_PROVIDER_ALIASES.values())
+_CANONICAL_STT_PROVIDERS = frozenset(_STT_PROVIDER_ALIASES.values())
+_CANONICAL_TTS_PROVIDERS = frozenset(_TTS_PROVIDER_ALIASES.values())
+
+
+def _pick(primary: Mapping[str, Any], secondary: Mapping[str, Any], *keys: str, default: Any = None) -> Any:
+    """Return the first truthy config value for ``keys``.
+
+    Each key is looked up in ``primary`` then ``secondary`` before moving on
+    to the next key; ``default`` is returned if nothing is set.
+    """
+    for key in keys:
+        value = primary.get(key) or secondary.get(key)
+        if value:
+            return value
+    return default
+
+
+def _first(config: Mapping[str, Any], *keys: str) -> Any:
+    """Return the value of the first key in ``config`` that is not None.
+
+    Unlike chaining ``or``, an explicit falsy value (e.g. ``""``) is kept.
+    """
+    for key in keys:
+        value = config.get(key)
+        if value is not None:
+            return value
+    return None
+
+
+def _normalize_provider(
+    provider: Optional[str], aliases: Mapping[str, str], canonical: frozenset
+) -> Optional[str]:
+    """Resolve a configured provider name to its canonical key."""
+    if not provider or provider in canonical:
+        return provider
+    return aliases.get(provider.lower(), provider)
+
+
+# === Config parsing ===
+
+def _parse_spec(
+    config: Mapping[str, Any], provider: Optional[str], default_language: Optional[str] = None
+) -> ServiceSpec:
+    return ServiceSpec(
+        provider=provider,
+        language=config.get("language") or default_language,
+        config=config,
+        args=config.get("args", {}),
+    )
+
+
+def parse_llm_spec(llm_config: Mapping[str, Any]) -> ServiceSpec:
+    """Parse an LLM config block ('name' or 'provider', optional 'args')."""
+    provider = _normalize_provider(
+        _first(llm_config, "name", "provider"), _LLM_PROVIDER_ALIASES, _CANONICAL_LLM_PROVIDERS
+    )
+    return _parse_spec(llm_config, provider)
+
+
+def parse_stt_spec(
+    stt_config: Mapping[str, Any], default_language: Optional[str] = None
+) -> ServiceSpec:
+    """Parse an STT config block ('name', 'language', optional 'args')."""
+    provider = _normalize_provider(
+        stt_config.get("name"), _STT_PROVIDER_ALIASES, _CANONICAL_STT_PROVIDERS
+    )
+    return _parse_spec(stt_config, provider, default_language)
+
+
+def parse_tts_spec(
+    tts_config: Mapping[str, Any], default_language: Optional[str] = None
+) -> ServiceSpec:
+    """Parse a TTS config block ('name', 'language', optional 'args')."""
+    provider = _normalize_provider(
+        tts_config.get("name"), _TTS_PROVIDER_ALIASES, _CANONICAL_TTS_PROVIDERS
+    )
+    return _parse_spec(tts_config, provider, default_language)
+
+
+# Parsed specs keyed by id() of the agent config. Entries keep a reference to
+# the config itself, so an id cannot be reused while its entry is cached.
+_SPEC_CACHE_SIZE = 64
+_spec_cache: "OrderedDict[int, Tuple[Mapping[str, Any], ServiceSpecs]]" = OrderedDict()
+
+
+def parse_service_specs(agent_config: Mapping[str, Any]) -> ServiceSpecs:
+    """Parse the llm/stt/tts blocks of an agent config into service specs.
+
+    Agent configs are shared read-only mappings (see
+    ``api.backend_utils.get_agent_config``), so the result is cached per
+    config object and reused by every call made with it.
+
+    Args:
+        agent_config: Agent configuration mapping
+
+    Returns:
+        Parsed specs; STT/TTS language falls back to the agent's 'language'
+    """
+    key = id(agent_config)
+    cached = _spec_cache.get(key)
+    if cached is not None and cached[0] is agent_config:
+        _spec_cache.move_to_end(key)
+        return cached[1]
+
+    language = agent_config.get("language")
+    specs = ServiceSpecs(
+        llm=parse_llm_spec(agent_config.get("llm_model", {})),
+        stt=parse_stt_spec(agent_config.get("stt_model", {}), language),
+        tts=parse_tts_spec(agent_config.get("tts_model", {}), language),
+    )
+    _spec_cache[key] = (agent_config, specs)
+    if len(_spec_cache) > _SPEC_CACHE_SIZE:
+        _spec_cache.popitem(last=False)
+    return specs
+
+
+# === LLM builders ===
+#
+# Provider SDKs are imported inside each builder (directly or via
+# _keyed_service) so the server only pays the import cost (grpc, websockets,
+# HTTP clients) for providers actually in use.
+
+def _build_openai_llm(spec: ServiceSpec) -> Any:
+    from pipecat.processors.aggregators.llm_response import LLMUserAggregatorParams
+    OpenAILLMService = _keyed_service(
+        "pipecat.services.openai.llm", "OpenAILLMService", "OPENAI_API_KEY"
+    )
+
+    args = spec.args
+    model = _pick(args, spec.config, "model")
+
+    # Extract user aggregator params from config, with defaults
+    user_aggregator_params = LLMUserAggregatorParams(
+        aggregation_timeout=args.get("aggregation_timeout", 0.05)
+    )
+
+    resolved_model = get_llm_model("OpenAI", model)
+    logger.info("OpenAI LLM: model={}", resolved_model)
+
+    service = OpenAILLMService(
+        model=resolved_model,
+    )
+
+    # Store user aggregator params on the service instance for later use
+    service._user_aggregator_params = user_aggregator_params
+
+    return service
+
+
+def _build_gemini_llm(spec: ServiceSpec) -> Any:
+    from pipecat.processors.aggregators.llm_response import LLMUserAggregatorParams
+    GoogleLLMService = _keyed_service(
+        "pipecat.services.google.llm", "GoogleLLMService", "GOOGLE_API_KEY", "GEMINI_API_KEY"
+    )
+
+    # Google Gemini LLM
+    args = spec.args
+    model = _pick(args, spec.config, "model")
+
+    resolved_model = get_llm_model("Gemini", model)
+    logger.info("Gemini LLM: model={}", resolved_model)
+
+    user_aggregator_params = LLMUserAggregatorParams(
+        aggregation_timeout=args.get("aggregation_timeout", 0.05)
+    )
+
+    service = GoogleLLMService(
+        model=resolved_model,
+    )
+
+    # Store user aggregator params on the service instance for later use
+    service._user_aggregator_params = user_aggregator_params
+
+    return service
+
+
+def _build_kenpath_llm(spec: ServiceSpec) -> Any:
+    from services.kenpath_llm.llm import KenpathLLM
+
+    return KenpathLLM()
 
-        # Store user aggregator params on the service instance for later use
-        service._user_aggregator_params = user_aggregator_params
 
-        return service
+# === STT builders ===
 
-    elif provider == "Gemini":
-        # Google Gemini LLM
-        resolved_model = get_llm_model(provider, model)
-        logger.info(f"Gemini LLM: model={resolved_model}")
+def _build_deepgram_stt(spec: ServiceSpec, sample_rate: int, vad_analyzer: Any) -> Any:
+    from deepgram import LiveOptions
+    DeepgramSTTService = _keyed_service(
+        "pipecat.services.deepgram.stt", "DeepgramSTTService", "DEEPGRAM_API_KEY"
+    )
 
-        user_aggregator_params = LLMUserAggregatorParams(
-            aggregation_timeout=args.get("aggregation_timeout", 0.05)
+    language = spec.language
+    args = spec.args
+    # Model is at top level for Deepgram (not in args)
+    model = _pick(spec.config, args, "model", default="nova-2")
+    logger.info("Deepgram STT: model={}, language={}", model, language)
+    return DeepgramSTTService(
+        sample_rate=sample_rate,
+        live_options=LiveOptions(
+            model=model,
+            language=STT_LANGUAGE_CODES[("Deepgram", language)],
+            channels=1,
+            encoding="linear16",
+            sample_rate=sample_rate,
+            interim_results=True,
+            endpointing=150,
+            smart_format=True,
+            punctuate=True,
+        ),
+    )
+
+
+def _build_google_stt(spec: ServiceSpec, sample_rate: int, vad_analyzer: Any) -> Any:
+    from pipecat.services.google.stt import GoogleSTTService
+
+    language = spec.language
+    return GoogleSTTService(
+        credentials_path=_env(
+            "GOOGLE_STT_CREDENTIALS_PATH", "credentials/google_stt.json"
+        ),
+        sample_rate=sample_rate,
+        params=GoogleSTTService.InputParams(
+            languages=[STT_LANGUAGE_CODES[("Google", language)]]
+        ),
+    )
+
+
+def _build_openai_stt(spec: ServiceSpec, sample_rate: int, vad_analyzer: Any) -> Any:
+    OpenAISTTService = _keyed_service(
+        "pipecat.services.openai.stt", "OpenAISTTService", "OPENAI_API_KEY"
+    )
+
+    language = spec.language
+    return OpenAISTTService(
+        language=STT_LANGUAGE_CODES[("OpenAI", language)],
+    )
+
+
+def _build_ai4bharat_stt(spec: ServiceSpec, sample_rate: int, vad_analyzer: Any) -> Any:
+    from services.ai4bharat.stt import IndicConformerRESTSTTService
+
+    language = spec.language
+    args = spec.args
+    model = _pick(args, spec.config, "model")
+    if model == "indic-conformer-stt":
+        return IndicConformerRESTSTTService(
+            language_id=STT_LANGUAGE_CODES[("AI4Bharat", language)],
+            sample_rate=16000,
+            input_sample_rate=sample_rate,
+            vad_analyzer=vad_analyzer,
         )
+    raise ServiceCreationError(
+        f"Unknown ai4bharat STT model: {model}. Expected 'indic-conformer-stt'"
+    )
+
+
+def _build_bhashini_stt(spec: ServiceSpec, sample_rate: int, vad_analyzer: Any) -> Any:
+    BhashiniSTTService = _keyed_service(
+        "services.bhashini.stt", "BhashiniSTTService", "BHASHINI_API_KEY"
+    )
+
+    language = spec.language
+    args = spec.args
+    return BhashiniSTTService(
+        language=STT_LANGUAGE_CODES[("Bhashini", language)],
+        service_id=args.get(
+            "model", "bhashini/ai4bharat/conformer-multilingual-asr"
+        ),
+        sample_rate=sample_rate,
+    )
+
+
+def _build_sarvam_stt(spec: ServiceSpec, sample_rate: int, vad_analyzer: Any) -> Any:
+    SarvamSTTService = _keyed_service(
+        "pipecat.services.sarvam.stt", "SarvamSTTService", "SARVAM_API_KEY"
+    )
+
+    language = spec.language
+    args = spec.args
+    # Model is at top level for Sarvam (not in args)
+    model = _pick(spec.config, args, "model", default="saarika:v2")
+    logger.info("Sarvam STT: model={}, language={}", model, language)
+    return SarvamSTTService(
+        language=STT_LANGUAGE_CODES[("Sarvam", language)],
+        model=model,
+        sample_rate=sample_rate,
+    )
+
 
-        service = GoogleLLMService(
-            api_key=os.getenv("GOOGLE_API_KEY") or os.getenv("GEMINI_API_KEY"),
-            model=resolved_model,
+# === TTS builders ===
+
+_AURA_PREFIX = "aura-"
+
+
+def _deepgram_voice(model: str, speaker: str) -> str:
+    """Build the Deepgram voice name for a speaker.
+
+    Deepgram voice format depends on model version:
+    - Aura-2: aura-2-{voice}-en (e.g., aura-2-thalia-en, aura-2-arcas-en)
+    - Aura-1: aura-{voice}-en (e.g., aura-asteria-en, aura-arcas-en)
+    """
+    # If the voice already has the full format, use it as-is
+    if speaker.startswith(_AURA_PREFIX):
+        return speaker
+    if model == "aura-2":
+        return f"aura-2-{speaker}-en"
+    # Aura-1 or other versions
+    return f"aura-{speaker}-en"
+
+
+_DEEPGRAM_AURA_2_SPEAKERS = (
+    "amalthea", "andromeda", "apollo", "arcas", "aries", "asteria", "athena",
+    "atlas", "aurora", "callista", "cora", "cordelia", "delia", "draco",
+    "electra", "harmonia", "helena", "hera", "hermes", "hyperion", "iris",
+    "janus", "juno", "jupiter", "luna", "mars", "minerva", "neptune",
+    "odysseus", "ophelia", "orion", "orpheus", "pandora", "phoebe", "pluto",
+    "saturn", "selene", "thalia", "theia", "vesta", "zeus",
+)
+_DEEPGRAM_AURA_1_SPEAKERS = (
+    "angus", "arcas", "asteria", "athena", "helios", "hera", "luna", "orion",
+    "orpheus", "perseus", "stella", "zeus",
+)
+
+# (model, speaker) -> voice for known speakers; others fall back to _deepgram_voice
+_DEEPGRAM_VOICES = MappingProxyType({
+    **{("aura-2", speaker): _deepgram_voice("aura-2", speaker) for speaker in _DEEPGRAM_AURA_2_SPEAKERS},
+    **{
+        (model, speaker): _deepgram_voice(model, speaker)
+        for model in ("aura", "aura-1")
+        for speaker in _DEEPGRAM_AURA_1_SPEAKERS
+    },
+})
+
+
+def _resolve_deepgram_voice(model: str, speaker: str) -> str:
+    """Resolve the Deepgram voice for a model/speaker pair, using the table when possible."""
+    return _DEEPGRAM_VOICES.get((model, speaker)) or _deepgram_voice(model, speaker)
+
+
+def _build_deepgram_tts(spec: ServiceSpec, sample_rate: int) -> Any:
+    DeepgramTTSService = _keyed_service(
+        "pipecat.services.deepgram.tts", "DeepgramTTSService", "DEEPGRAM_API_KEY"
+    )
+
+    args = spec.args
+    speaker = _pick(args, spec.config, "speaker", default="asteria")
+    model = _pick(args, spec.config, "model", default="aura-2")
+    voice = _resolve_deepgram_voice(model, speaker)
+
+    logger.info("Deepgram TTS: model={}, speaker={}, voice={}", model, speaker, voice)
+    return DeepgramTTSService(
+        voice=voice,
+    )
+
+
+def _build_cartesia_tts(spec: ServiceSpec, sample_rate: int) -> Any:
+    CartesiaTTSService = _keyed_service(
+        "pipecat.services.cartesia.tts", "CartesiaTTSService", "CARTESIA_API_KEY"
+    )
+
+    args = spec.args
+    model = args.get("model")
+    voice_id = args.get("voice_id")
+    return CartesiaTTSService(
+        model=model,
+        encoding="pcm_s16le",
+        voice_id=voice_id,
+    )
+
+
+def _build_google_tts(spec: ServiceSpec, sample_rate: int) -> Any:
+    from pipecat.services.google.tts import GoogleTTSService
+
+    language = spec.language
+    args = spec.args
+    lang_code = TTS_LANGUAGE_CODES[("Google", language)]
+    voice_id = _pick(args, spec.config, "voice_id")
+    return GoogleTTSService(
+        credentials_path=_env(
+            "GOOGLE_TTS_CREDENTIALS_PATH", "credentials/google_tts.json"
+        ),
+        voice_id=voice_id,
+        params=GoogleTTSService.InputParams(language=lang_code),
+    )
+
+
+def _build_openai_tts(spec: ServiceSpec, sample_rate: int) -> Any:
+    OpenAITTSService = _keyed_service(
+        "pipecat.services.openai.tts", "OpenAITTSService", "OPENAI_API_KEY"
+    )
+
+    args = spec.args
+    # OpenAI TTS models: tts-1, tts-1-hd, gpt-4o-mini-tts
+    # Voices: alloy, echo, fable, onyx, nova, shimmer
+    model = _pick(spec.config, args, "model", default="tts-1")
+    # Sources alternate per key, so the chain is spelled out rather than
+    # _pick'd: config.speaker, then args.voice, then config.voice_id
+    voice = (
+        spec.config.get("speaker")
+        or args.get("voice")
+        or spec.config.get("voice_id")
+        or "alloy"
+    )
+    logger.info("OpenAI TTS: model={}, voice={}", model, voice)
+    return OpenAITTSService(
+        model=model,
+        voice=voice,
+    )
+
+
+def _build_ai4bharat_tts(spec: ServiceSpec, sample_rate: int) -> Any:
+    from services.ai4bharat.tts import IndicParlerRESTTTSService
+
+    args = spec.args
+    model = _pick(args, spec.config, "model")
+    if model == "indic-parler-tts":
+        speaker = _pick(spec.config, args, "speaker")
+        description = _pick(spec.config, args, "description")
+        return IndicParlerRESTTTSService(
+            speaker=speaker, description=description, sample_rate=sample_rate
         )
+    raise ServiceCreationError(
+        f"Unknown ai4bharat TTS model: {model}. Expected 'indic-parler-tts'"
+    )
+
+
+def _build_bhashini_tts(spec: ServiceSpec, sample_rate: int) -> Any:
+    from services.bhashini.tts import BhashiniTTSService
+
+    args = spec.args
+    speaker = _pick(spec.config, args, "speaker")
+    description = _pick(spec.config, args, "description")
+    return BhashiniTTSService(
+        speaker=speaker, description=description, sample_rate=44100
+    )
 
-        # Store user aggregator params on the service instance for later use
-        service._user_aggregator_params = user_aggregator_params
 
-        return service
+def _to_float(value: Any, default: Optional[float] = None) -> Optional[float]:
+    """Convert a configured numeric value to float, treating unset as ``default``."""
+    return float(value) if value else default
 
-    elif provider == "Kenpath":
-        return KenpathLLM()
 
-    else:
-        raise ServiceCreationError(f"Unknown LLM provider: {provider}")
+def _sarvam_pace(tts_config: dict, args: dict) -> Optional[float]:
+    """Pace from config.pace, then args.pace, then config.speed (args.speed is not read)."""
+    return _to_float(tts_config.get("pace") or args.get("pace") or tts_config.get("speed"))
+
+
+def _sarvam_v2_params(tts_config: dict, args: dict) -> dict:
+    """Voice controls for bulbul:v2, which supports pitch, pace and loudness."""
+    return {
+        "pitch": _to_float(_pick(tts_config, args, "pitch")),
+        "pace": _sarvam_pace(tts_config, args),
+        "loudness": _to_float(_pick(tts_config, args, "loudness")),
+    }
+
+
+def _sarvam_v3_params(tts_config: dict, args: dict) -> dict:
+    """Voice controls for bulbul:v3, which only supports pace."""
+    return {"pace": _sarvam_pace(tts_config, args)}
+
+
+_SARVAM_PARAM_BUILDERS: Dict[str, Callable[[dict, dict], dict]] = {
+    "bulbul:v2": _sarvam_v2_params,
+    "bulbul:v3": _sarvam_v3_params,
+    "bulbul:v3-beta": _sarvam_v3_params,
+}
+
+
+def _build_sarvam_tts(spec: ServiceSpec, sample_rate: int) -> Any:
+    SarvamTTSService = _keyed_service(
+        "pipecat.services.sarvam.tts", "SarvamTTSService", "SARVAM_API_KEY"
+    )
+
+    language = spec.language
+    args = spec.args
+    # Sarvam config is at top level (not in args)
+    model = _pick(spec.config, args, "model", default="bulbul:v2")
+    speaker = _pick(spec.config, args, "speaker")
+    params = _SARVAM_PARAM_BUILDERS.get(model, _sarvam_v2_params)(spec.config, args)
+    logger.info("Sarvam TTS: model={}, speaker={}, params={}", model, speaker, params)
+    return SarvamTTSService(
+        target_language_code=TTS_LANGUAGE_CODES[("Sarvam", language)],
+        model=model,
+        speaker=speaker,
+        **params,
+    )
+
+
+# === Dispatch tables (canonical provider key -> builder) ===
+#
+# Builders return a fresh instance on every call on purpose. Pipecat services
+# are frame processors linked into exactly one pipeline and hold per-session
+# state (sockets, audio buffers, interruption state), so they cannot be cached
+# and shared between calls. Only the config-derived lookups are cached.
+
+_LLM_BUILDERS: Dict[str, Callable[[ServiceSpec], Any]] = {
+    "OpenAI": _build_openai_llm,
+    "Gemini": _build_gemini_llm,
+    "Kenpath": _build_kenpath_llm,
+}
+
+_STT_BUILDERS: Dict[str, Callable[[ServiceSpec, int, Any], Any]] = {
+    "Deepgram": _build_deepgram_stt,
+    "Google": _build_google_stt,
+    "OpenAI": _build_openai_stt,
+    "AI4Bharat": _build_ai4bharat_stt,
+    "Bhashini": _build_bhashini_stt,
+    "Sarvam": _build_sarvam_stt,
+}
+
+_TTS_BUILDERS: Dict[str, Callable[[ServiceSpec, int], Any]] = {
+    "Deepgram": _build_deepgram_tts,
+    "Cartesia": _build_cartesia_tts,
+    "Google": _build_google_tts,
+    "OpenAI": _build_openai_tts,
+    "AI4Bharat": _build_ai4bharat_tts,
+    "Bhashini": _build_bhashini_tts,
+    "Sarvam": _build_sarvam_tts,
+}
+
+
+def create_llm_service(llm_config: Union[Mapping[str, Any], ServiceSpec]) -> Any:
+    """Create an LLM service based on configuration.
+
+    Args:
+        llm_config: LLM configuration dict with 'name' and optional 'args',
+            or a spec already parsed with parse_llm_spec/parse_service_specs
+
+    Returns:
+        Configured LLM service instance
+
+    Raises:
+        ServiceCreationError: If the LLM provider is unknown
+    """
+    spec = llm_config if isinstance(llm_config, ServiceSpec) else parse_llm_spec(llm_config)
+
+    try:
+        builder = _LLM_BUILDERS[spec.provider]
+    except KeyError:
+        raise ServiceCreationError(f"Unknown LLM provider: {spec.provider}") from None
+    return builder(spec)
 
 
 def create_stt_service(
-    stt_config: dict, sample_rate: int, vad_analyzer: Any = None
+    stt_config: Union[Mapping[str, Any], ServiceSpec], sample_rate: int, vad_analyzer: Any = None
 ) -> Any:
     """Create an STT service based on configuration.
 
     Args:
-        stt_config: STT configuration dict with 'name', 'language', and optional 'args'
+        stt_config: STT configuration dict with 'name', 'language', and optional 'args',
+            or a spec already parsed with parse_stt_spec/parse_service_specs
         sample_rate: Audio sample rate in Hz
         vad_analyzer: Optional VAD analyzer instance for direct state monitoring
 
@@ -123,102 +669,21 @@ def create_stt_service(
     Raises:
         ServiceCreationError: If the STT provider is unknown
     """
-    provider = stt_config.get("name")
-    language = stt_config.get("language")
-    args = stt_config.get("args", {})
-
-    # Normalize provider name to match map keys (capitalize first letter, handle special cases)
-    provider_map = {
-        "deepgram": "Deepgram",
-        "google": "Google",
-        "openai": "OpenAI",
-        "sarvam": "Sarvam",
-        "ai4bharat": "AI4Bharat",
-        "bhashini": "Bhashini",
-    }
-    provider = provider_map.get(provider.lower(), provider)
-
-    if provider == "Deepgram":
-        # Model is at top level for Deepgram (not in args)
-        model = stt_config.get("model") or args.get("model") or "nova-2"
-        logger.info(f"Deepgram STT: model={model}, language={language}")
-        return DeepgramSTTService(
-            api_key=os.getenv("DEEPGRAM_API_KEY"),
-            sample_rate=sample_rate,
-            live_options=LiveOptions(
-                model=model,
-                language=STT_LANGUAGE_MAP[provider][language],
-                channels=1,
-                encoding="linear16",
-                sample_rate=sample_rate,
-                interim_results=True,
-                endpointing=150,
-                smart_format=True,
-                punctuate=True,
-            ),
-        )
-
-    elif provider == "Google":
-        return GoogleSTTService(
-            credentials_path=os.getenv(
-                "GOOGLE_STT_CREDENTIALS_PATH", "credentials/google_stt.json"
-            ),
-            sample_rate=sample_rate,
-            params=GoogleSTTService.InputParams(
-                languages=[STT_LANGUAGE_MAP[provider][language]]
-            ),
-        )
-
-    elif provider == "OpenAI":
-        return OpenAISTTService(
-            api_key=os.getenv("OPENAI_API_KEY"),
-            language=STT_LANGUAGE_MAP[provider][language],
-        )
+    spec = stt_config if isinstance(stt_config, ServiceSpec) else parse_stt_spec(stt_config)
 
-    elif provider == "AI4Bharat":
-        model = args.get("model") or stt_config.get("model")
-        if model == "indic-conformer-stt":
-            return IndicConformerRESTSTTService(
-                language_id=STT_LANGUAGE_MAP[provider][language],
-                sample_rate=16000,
-                input_sample_rate=sample_rate,
-                vad_analyzer=vad_analyzer,
-            )
-        else:
-            raise ServiceCreationError(
-                f"Unknown ai4bharat STT model: {model}. Expected 'indic-conformer-stt'"
-            )
-
-    elif provider == "Bhashini":
-        return BhashiniSTTService(
-            api_key=os.getenv("BHASHINI_API_KEY"),
-            language=STT_LANGUAGE_MAP[provider][language],
-            service_id=args.get(
-                "model", "bhashini/ai4bharat/conformer-multilingual-asr"
-            ),
-            sample_rate=sample_rate,
-        )
-
-    elif provider == "Sarvam":
-        # Model is at top level for Sarvam (not in args)
-        model = stt_config.get("model") or args.get("model") or "saarika:v2"
-        logger.info(f"Sarvam STT: model={model}, language={language}")
-        return SarvamSTTService(
-            api_key=os.getenv("SARVAM_API_KEY"),
-            language=STT_LANGUAGE_MAP[provider][language],
-            model=model,
-            sample_rate=sample_rate,
-        )
+    try:
+        builder = _STT_BUILDERS[spec.provider]
+    except KeyError:
+        raise ServiceCreationError(f"Unknown STT provider: {spec.provider}") from None
+    return builder(spec, sample_rate, vad_analyzer)
 
-    else:
-        raise ServiceCreationError(f"Unknown STT provider: {provider}")
 
-
-def create_tts_service(tts_config: dict, sample_rate: int) -> Any:
+def create_tts_service(tts_config: Union[Mapping[str, Any], ServiceSpec], sample_rate: int) -> Any:
     """Create a TTS service based on configuration.
 
     Args:
-        tts_config: TTS configuration dict with 'name', 'language', and optional 'args'
+        tts_config: TTS configuration dict with 'name', 'language', and optional 'args',
+            or a spec already parsed with parse_tts_spec/parse_service_specs
         sample_rate: Audio sample rate in Hz (used for some services)
 
     Returns:
@@ -227,123 +692,10 @@ def create_tts_service(tts_config: dict, sample_rate: int) -> Any:
     Raises:
         ServiceCreationError: If the TTS provider is unknown
     """
-    provider = tts_config.get("name")
-    language = tts_config.get("language")
-    args = tts_config.get("args", {})
-
-    # Normalize provider name to match map keys (capitalize first letter, handle special cases)
-    provider_map = {
-        "cartesia": "Cartesia",
-        "google": "Google",
-        "openai": "OpenAI",
-        "sarvam": "Sarvam",
-        "ai4bharat": "AI4Bharat",
-        "bhashini": "Bhashini",
-        "deepgram": "Deepgram",
-    }
-    provider = provider_map.get(provider.lower(), provider)
-
-    if provider == "Deepgram":
-        # Deepgram voice format depends on model version:
-        # - Aura-2: aura-2-{voice}-en (e.g., aura-2-thalia-en, aura-2-arcas-en)
-        # - Aura-1: aura-{voice}-en (e.g., aura-asteria-en, aura-arcas-en)
-        speaker = args.get("speaker") or tts_config.get("speaker") or "asteria"
-        model = args.get("model") or tts_config.get("model") or "aura-2"
-
-        # If the voice already has the full format, use it as-is
-        if speaker.startswith("aura-"):
-            voice = speaker
-        else:
-            # Construct voice based on model version
-            if model == "aura-2":
-                voice = f"aura-2-{speaker}-en"
-            else:
-                # Aura-1 or other versions
-                voice = f"aura-{speaker}-en"
-
-        logger.info(f"Deepgram TTS: model={model}, speaker={speaker}, voice={voice}")
-        return DeepgramTTSService(
-            api_key=os.getenv("DEEPGRAM_API_KEY"),
-            voice=voice,
-        )
-
-    elif provider == "Cartesia":
-        model = args.get("model")
-        voice_id = args.get("voice_id")
-        return CartesiaTTSService(
-            api_key=os.getenv("CARTESIA_API_KEY"),
-            model=model,
-            encoding="pcm_s16le",
-            voice_id=voice_id,
-        )
-
-    elif provider == "Google":
-        lang_code = TTS_LANGUAGE_MAP[provider][language]
-        voice_id = args.get("voice_id") or tts_config.get("voice_id")
-        return GoogleTTSService(
-            credentials_path=os.getenv(
-                "GOOGLE_TTS_CREDENTIALS_PATH", "credentials/google_tts.json"
-            ),
-            voice_id=voice_id,
-            params=GoogleTTSService.InputParams(language=lang_code),
-        )
-
-    elif provider == "OpenAI":
-        # OpenAI TTS models: tts-1, tts-1-hd, gpt-4o-mini-tts
-        # Voices: alloy, echo, fable, onyx, nova, shimmer
-        model = tts_config.get("model") or args.get("model") or "tts-1"
-        voice = (
-            tts_config.get("speaker")
-            or args.get("voice")
-            or tts_config.get("voice_id")
-            or "alloy"
-        )
-        logger.info(f"OpenAI TTS: model={model}, voice={voice}")
-        return OpenAITTSService(
-            api_key=os.getenv("OPENAI_API_KEY"),
-            model=model,
-            voice=voice,
-        )
-
-    elif provider == "AI4Bharat":
-        model = args.get("model") or tts_config.get("model")
-        if model == "indic-parler-tts":
-            speaker = tts_config.get("speaker") or args.get("speaker")
-            description = tts_config.get("description") or args.get("description")
-            return IndicParlerRESTTTSService(
-                speaker=speaker, description=description, sample_rate=sample_rate
-            )
-        else:
-            raise ServiceCreationError(
-                f"Unknown ai4bharat TTS model: {model}. Expected 'indic-parler-tts'"
-            )
-
-    elif provider == "Bhashini":
-        speaker = tts_config.get("speaker") or args.get("speaker")
-        description = tts_config.get("description") or args.get("description")
-        return BhashiniTTSService(
-            speaker=speaker, description=description, sample_rate=44100
-        )
-
-    elif provider == "Sarvam":
-        # Sarvam config is at top level (not in args)
-        model = tts_config.get("model") or args.get("model") or "bulbul:v2"
-        speaker = tts_config.get("speaker") or args.get("speaker")
-        pitch = tts_config.get("pitch") or args.get("pitch")
-        pace = tts_config.get("pace") or args.get("pace") or tts_config.get("speed")
-        loudness = tts_config.get("loudness") or args.get("loudness")
-        logger.info(
-            f"Sarvam TTS: model={model}, speaker={speaker}, pitch={pitch}, pace={pace}, loudness={loudness}"
-        )
-        return SarvamTTSService(
-            api_key=os.getenv("SARVAM_API_KEY"),
-            target_language_code=TTS_LANGUAGE_MAP[provider][language],
-            model=model,
-            speaker=speaker,
-            pitch=pitch,
-            pace=pace,
-            loudness=loudness,
-        )
+    spec = tts_config if isinstance(tts_config, ServiceSpec) else parse_tts_spec(tts_config)
 
-    else:
-        raise ServiceCreationError(f"Unknown TTS provider: {provider}")
+    try:
+        builder = _TTS_BUILDERS[spec.provider]
+    except KeyError:
+        raise ServiceCreationError(f"Unknown TTS provider: {spec.provider}") from None
+    return builder(spec, sample_rate)
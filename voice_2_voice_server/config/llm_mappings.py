@@ -1,9 +1,12 @@
 # LLM Configuration Mappings
 # Default models and available models for each LLM provider
 
-# Available models for each provider
-LLM_AVAILABLE_MODELS = {
-    "OpenAI": [
+from functools import lru_cache
+from types import MappingProxyType
+
+# Available models for each provider (read-only; values are shared tuples)
+LLM_AVAILABLE_MODELS = MappingProxyType({
+    "OpenAI": (
         # GPT-5 series (latest)
         "gpt-5.2",
         "gpt-5.1",
@@ -21,8 +24,8 @@ LLM_AVAILABLE_MODELS = {
         "gpt-4-turbo",
         "gpt-4",
         "gpt-3.5-turbo",
-    ],
-    "Gemini": [
+    ),
+    "Gemini": (
         # Gemini 3 series (latest - preview)
         "gemini-3.0-pro",
         "gemini-3.0-flash",
@@ -30,9 +33,9 @@ LLM_AVAILABLE_MODELS = {
         "gemini-2.5-pro",
         "gemini-2.5-flash",
         "gemini-2.5-flash-lite",
-    ],
-    "Kenpath": [None],  # Kenpath doesn't need a model parameter
-}
+    ),
+    "Kenpath": (None,),  # Kenpath doesn't need a model parameter
+})
 
 # Default models for each provider
 LLM_DEFAULT_MODELS = {
@@ -42,6 +45,22 @@ LLM_DEFAULT_MODELS = {
 }
 
 
+# Map lower-case provider names to the keys used above
+_PROVIDER_KEY = {
+    "openai": "OpenAI",
+    "gemini": "Gemini",
+    "google": "Gemini",
+    "kenpath": "Kenpath",
+}
+
+
+def _provider_key(provider: str) -> str:
+    """Normalize a provider name to its mapping key."""
+    provider_normalized = provider.lower() if provider else ""
+    return _PROVIDER_KEY.get(provider_normalized, provider)
+
+
+@lru_cache(maxsize=32)
 def get_llm_model(provider: str, model: str = None) -> str:
     """
     Get the model name for an LLM provider.
@@ -53,22 +72,14 @@ def get_llm_model(provider: str, model: str = None) -> str:
     Returns:
         Model name to use
     """
-    # Normalize provider name
-    provider_normalized = provider.lower() if provider else ""
-    provider_key = {
-        "openai": "OpenAI",
-        "gemini": "Gemini",
-        "google": "Gemini",
-        "kenpath": "Kenpath",
-    }.get(provider_normalized, provider)
-
     if model:
         return model
 
-    return LLM_DEFAULT_MODELS.get(provider_key, "gpt-4o")
+    return LLM_DEFAULT_MODELS.get(_provider_key(provider), "gpt-4o")
 
 
-def get_available_llm_models(provider: str) -> list:
+@lru_cache(maxsize=32)
+def get_available_llm_models(provider: str) -> tuple:
     """
     Get available models for an LLM provider.
 
@@ -76,14 +87,6 @@ def get_available_llm_models(provider: str) -> list:
         provider: LLM provider name
 
     Returns:
-        List of available model names
+        Tuple of available model names (shared; copy with list() to modify)
     """
-    provider_normalized = provider.lower() if provider else ""
-    provider_key = {
-        "openai": "OpenAI",
-        "gemini": "Gemini",
-        "google": "Gemini",
-        "kenpath": "Kenpath",
-    }.get(provider_normalized, provider)
-
-    return LLM_AVAILABLE_MODELS.get(provider_key, [])
+    return LLM_AVAILABLE_MODELS.get(_provider_key(provider), ())
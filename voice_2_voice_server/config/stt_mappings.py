@@ -97,4 +97,13 @@ STT_LANGUAGE_MAP = {
         "Sindhi": "sd",
         "Urdu": "ur",
     },
-}
\ No newline at end of file
+}
+
+
+# Flat (provider, language) -> code view of the table above, so service
+# factories resolve a language code with a single lookup
+STT_LANGUAGE_CODES = {
+    (provider, language): code
+    for provider, languages in STT_LANGUAGE_MAP.items()
+    for language, code in languages.items()
+}
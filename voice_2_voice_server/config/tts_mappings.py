@@ -73,3 +73,10 @@ TTS_LANGUAGE_MAP = {
 }
 
 
+# Flat (provider, language) -> code view of the table above, so service
+# factories resolve a language code with a single lookup
+TTS_LANGUAGE_CODES = {
+    (provider, language): code
+    for provider, languages in TTS_LANGUAGE_MAP.items()
+    for language, code in languages.items()
+}
@@ -1,5 +1,8 @@
 import base64
 import json
+from functools import lru_cache
+
+from pydantic import ConfigDict
 from pipecat.serializers.plivo import PlivoFrameSerializer
 from pipecat.frames.frames import (
     AudioRawFrame, 
@@ -14,6 +17,9 @@ class VobizFrameSerializer(PlivoFrameSerializer):
     """
     
     class InputParams(PlivoFrameSerializer.InputParams):
+        # Immutable so one instance can be shared by every call (see for_sample_rate)
+        model_config = ConfigDict(frozen=True)
+
         def __init__(
             self,
             vobiz_sample_rate: int = 8000,
@@ -25,6 +31,12 @@ class VobizFrameSerializer(PlivoFrameSerializer):
                 sample_rate=sample_rate,
                 auto_hang_up=auto_hang_up
             )
+
+        @classmethod
+        @lru_cache(maxsize=None)
+        def for_sample_rate(cls, sample_rate: int) -> "VobizFrameSerializer.InputParams":
+            """Return the shared params instance for a Vobiz stream at ``sample_rate``."""
+            return cls(vobiz_sample_rate=sample_rate, sample_rate=sample_rate)
     
     def __init__(
         self,
@@ -8,6 +8,9 @@ import asyncio
 import base64
 import time
 from typing import AsyncGenerator, Optional, Dict, Any
+
+import numpy as np
+import soxr
 from loguru import logger
 
 from pipecat.frames.frames import (
@@ -19,7 +22,6 @@ from pipecat.frames.frames import (
     UserStoppedSpeakingFrame,
 )
 from pipecat.services.stt_service import STTService
-from pipecat.audio.utils import create_stream_resampler
 from pipecat.audio.vad.vad_analyzer import VADAnalyzer, VADState
 
 try:
@@ -29,6 +31,18 @@ except ImportError:
     AIOHTTP_AVAILABLE = False
     logger.warning("aiohttp package not installed. Install with: pip install aiohttp")
 
+# Cap on buffered audio per utterance; oldest audio is dropped beyond this
+MAX_BUFFER_SECS = 30
+# Shorter buffers (0.1 s at 16 kHz) are not worth a transcription round-trip
+MIN_TRANSCRIBE_SAMPLES = 1600
+# Buffers whose int16 peak stays below this are treated as silence (~-42 dBFS)
+SILENCE_PEAK_THRESHOLD = 250
+
+
+def _ts() -> str:
+    """Epoch milliseconds as a string, for transcription frame timestamps."""
+    return str(time.time_ns() // 1_000_000)
+
 
 class IndicConformerRESTSTTService(STTService):
     
@@ -50,77 +64,136 @@ class IndicConformerRESTSTTService(STTService):
         if not server_url:
             raise ValueError("INDIC_STT_SERVER_URL environment variable not set")
         
-        self._server_url = server_url.rstrip('/') + "/transcribe"
+        self._server_url = server_url.rstrip('/') + "/transcribe/raw"
+        # JSON/base64 endpoint for STT servers that predate /transcribe/raw
+        self._legacy_url = server_url.rstrip('/') + "/transcribe"
+        self._raw_supported = True
         self._language_id = language_id
         self._sample_rate = sample_rate
         self._input_sample_rate = input_sample_rate
         
         self._session: Optional[aiohttp.ClientSession] = None
+        self._timeout = aiohttp.ClientTimeout(total=10)
         self._vad_analyzer: Optional[VADAnalyzer] = vad_analyzer
         
-        self._audio_buffer = b""
-        self._text_chunks = []
+        self._pcm = np.empty(MAX_BUFFER_SECS * sample_rate, dtype=np.int16)
+        self._pcm_len = 0
+        self._accumulated = ""
+        self._text_chunk_count = 0
         self._is_speaking = False
         
-        self._stopping_start_time: Optional[float] = None
+        self._stopping_start_time: Optional[int] = None
         self._stopping_triggered = False
-        self._STOPPING_DURATION_MS = 10
+        self._STOPPING_DURATION_NS = 10 * 1_000_000
         
-        self._resampler = create_stream_resampler()
+        # Synchronous, stateful soxr stream: no per-frame await. Keeps the
+        # same VHQ filter Pipecat's stream resampler used
+        self._resampler: Optional[soxr.ResampleStream] = None
+        if input_sample_rate != sample_rate:
+            self._resampler = soxr.ResampleStream(
+                input_sample_rate, sample_rate, 1, dtype="int16", quality="VHQ"
+            )
         
         logger.info(f"IndicConformerRESTSTTService initialized - Server: {self._server_url}")
 
+    def _append_pcm(self, samples: np.ndarray) -> None:
+        capacity = self._pcm.size
+        if samples.size >= capacity:
+            samples = samples[-capacity:]
+            self._pcm_len = 0
+
+        end = self._pcm_len + samples.size
+        if end > capacity:
+            # Upstream is not flushing (e.g. a stalled STT server): keep the
+            # newest audio and drop at least a second of the oldest
+            drop = min(max(end - capacity, self._sample_rate), self._pcm_len)
+            logger.warning(f"STT buffer full, dropping {drop / self._sample_rate:.1f}s of oldest audio")
+            self._pcm[:self._pcm_len - drop] = self._pcm[drop:self._pcm_len]
+            self._pcm_len -= drop
+            end = self._pcm_len + samples.size
+
+        self._pcm[self._pcm_len:end] = samples
+        self._pcm_len = end
+
+    def _append_text(self, text: str) -> None:
+        self._accumulated = f"{self._accumulated} {text}" if self._accumulated else text
+        self._text_chunk_count += 1
+
+    def _reset_text(self) -> None:
+        self._accumulated = ""
+        self._text_chunk_count = 0
+
     async def _transcribe_buffer(self) -> str:
-        if not self._audio_buffer or len(self._audio_buffer) < 3200:
+        if self._pcm_len < MIN_TRANSCRIBE_SAMPLES:
+            return ""
+
+        pcm = self._pcm[:self._pcm_len]
+        if max(int(pcm.max()), -int(pcm.min())) < SILENCE_PEAK_THRESHOLD:
+            logger.debug("Skipping transcription of silent buffer")
             return ""
         
         try:
-            audio_b64 = base64.b64encode(self._audio_buffer).decode('utf-8')
-            
+            if self._raw_supported:
+                # Raw PCM body: no base64 inflation (+33%) or JSON encoding per flush
+                async with self._session.post(
+                    self._server_url,
+                    data=pcm.tobytes(),
+                    params={"language_id": self._language_id},
+                    headers={"Content-Type": "application/octet-stream"},
+                    timeout=self._timeout
+                ) as response:
+                    if response.status != 404:
+                        return await self._read_transcription(response)
+                logger.warning(
+                    f"STT server has no {self._server_url}, falling back to {self._legacy_url}"
+                )
+                self._raw_supported = False
+
             async with self._session.post(
-                self._server_url,
-                json={"audio_b64": audio_b64, "language_id": self._language_id},
-                timeout=aiohttp.ClientTimeout(total=10)
+                self._legacy_url,
+                json={
+                    "audio_b64": base64.b64encode(pcm.tobytes()).decode('utf-8'),
+                    "language_id": self._language_id,
+                },
+                timeout=self._timeout
             ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return data.get("text", "")
-                else:
-                    logger.error(f"Transcription request failed: {response.status}")
-                    return ""
+                return await self._read_transcription(response)
         except Exception as e:
             logger.error(f"Transcription error: {e}")
             return ""
 
+    async def _read_transcription(self, response: "aiohttp.ClientResponse") -> str:
+        if response.status == 200:
+            data = await response.json()
+            return data.get("text", "")
+        logger.error(f"Transcription request failed: {response.status}")
+        return ""
+
     def _check_stopping_state(self) -> bool:
         if self._vad_analyzer is None:
             return False
-        
-        try:
-            vad_state = self._vad_analyzer._vad_state
-            
-            if vad_state == VADState.STOPPING:
-                current_time = time.time() * 1000
-                
-                if self._stopping_start_time is None:
-                    self._stopping_start_time = current_time
-                    return False
-                
-                duration_ms = current_time - self._stopping_start_time
-                
-                if duration_ms >= self._STOPPING_DURATION_MS and not self._stopping_triggered:
-                    self._stopping_triggered = True
-                    return True
-                
-                return False
-            else:
-                self._stopping_start_time = None
-                self._stopping_triggered = False
-                return False
-                
-        except AttributeError:
+
+        # The analyzer exposes no state-change hook, so read its state and
+        # only touch the clock while a STOPPING window is still pending
+        if getattr(self._vad_analyzer, "_vad_state", None) != VADState.STOPPING:
+            self._stopping_start_time = None
+            self._stopping_triggered = False
             return False
 
+        if self._stopping_triggered:
+            return False
+
+        current_time = time.monotonic_ns()
+        if self._stopping_start_time is None:
+            self._stopping_start_time = current_time
+            return False
+
+        if current_time - self._stopping_start_time >= self._STOPPING_DURATION_NS:
+            self._stopping_triggered = True
+            return True
+
+        return False
+
     async def process_frame(self, frame: Frame, direction):
         # Handle UserStoppedSpeakingFrame BEFORE calling super() to ensure
         # TranscriptionFrame is pushed downstream BEFORE UserStoppedSpeakingFrame
@@ -134,17 +207,16 @@ class IndicConformerRESTSTTService(STTService):
             
             # Push final transcription BEFORE the UserStoppedSpeakingFrame
             # so aggregator receives transcription first, then stop frame
-            if self._text_chunks:
-                accumulated = " ".join(self._text_chunks)
-                logger.info(f"Final: {accumulated}")
+            if self._accumulated:
+                logger.info(f"Final: {self._accumulated}")
                 await self.push_frame(TranscriptionFrame(
-                    text=accumulated,
+                    text=self._accumulated,
                     user_id=self._user_id,
-                    timestamp=str(int(time.time() * 1000))
+                    timestamp=_ts()
                 ))
                 # Clear everything after sending
-                self._text_chunks = []
-                self._audio_buffer = b""
+                self._reset_text()
+                self._pcm_len = 0
         
         # Now call parent's process_frame which will push UserStoppedSpeakingFrame downstream
         await super().process_frame(frame, direction)
@@ -154,15 +226,20 @@ class IndicConformerRESTSTTService(STTService):
             self._is_speaking = True
             self._stopping_start_time = None
             self._stopping_triggered = False
-            self._audio_buffer = b""
-            self._text_chunks = []
+            self._pcm_len = 0
+            self._reset_text()
+            if self._resampler is not None:
+                self._resampler.clear()
 
     async def start(self, frame: Frame) -> None:
         logger.info("Starting IndicConformer REST STT service")
-        self._session = aiohttp.ClientSession()
+        # Keep-alive pool so back-to-back transcriptions reuse the same
+        # connection instead of reconnecting on every STOPPING flush
+        connector = aiohttp.TCPConnector(limit=32, ttl_dns_cache=300, keepalive_timeout=60)
+        self._session = aiohttp.ClientSession(connector=connector)
         self._is_speaking = False
-        self._audio_buffer = b""
-        self._text_chunks = []
+        self._pcm_len = 0
+        self._reset_text()
         self._stopping_start_time = None
         self._stopping_triggered = False
         await super().start(frame)
@@ -178,28 +255,22 @@ class IndicConformerRESTSTTService(STTService):
             return
         
         try:
-            resampled_audio = audio
-            if self._input_sample_rate != self._sample_rate:
-                resampled_audio = await self._resampler.resample(
-                    audio,
-                    self._input_sample_rate,
-                    self._sample_rate
-                )
-            
-            self._audio_buffer += resampled_audio            
+            samples = np.frombuffer(audio, dtype=np.int16)
+            if self._resampler is not None:
+                samples = self._resampler.resample_chunk(samples)
+            self._append_pcm(samples)
             if self._check_stopping_state():
                 logger.info("STOPPING state triggered, transcribing buffer")
                 text = await self._transcribe_buffer()
                 if text:
-                    self._text_chunks.append(text)
-                    accumulated = " ".join(self._text_chunks)
-                    logger.info(f"Interim: {accumulated}")
+                    self._append_text(text)
+                    logger.info(f"Interim: {self._accumulated}")
                     yield InterimTranscriptionFrame(
-                        text=accumulated,
+                        text=self._accumulated,
                         user_id=self._user_id,
-                        timestamp=str(int(time.time() * 1000))
+                        timestamp=_ts()
                     )
-                self._audio_buffer = b""
+                self._pcm_len = 0
             
             # Note: Final transcription is now sent immediately in process_frame()
             # when UserStoppedSpeakingFrame is received, matching WebSocket behavior
@@ -219,8 +290,8 @@ class IndicConformerRESTSTTService(STTService):
             "sample_rate": self._sample_rate,
             "input_sample_rate": self._input_sample_rate,
             "is_speaking": self._is_speaking,
-            "buffer_size": len(self._audio_buffer),
-            "text_chunks": len(self._text_chunks),
+            "buffer_size": self._pcm_len * 2,
+            "text_chunks": self._text_chunk_count,
         }
 
     def get_supported_languages(self) -> list:
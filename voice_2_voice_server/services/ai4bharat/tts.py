@@ -1,10 +1,11 @@
 import asyncio
 import base64
-import json
 import os
+import struct
 from typing import AsyncGenerator
 
 import aiohttp
+import orjson
 from loguru import logger
 from pipecat.frames.frames import (
     ErrorFrame,
@@ -15,6 +16,13 @@ from pipecat.frames.frames import (
 )
 from pipecat.services.tts_service import TTSService
 
+# Length prefix of each PCM chunk in the server's binary stream
+FRAME_HEADER = struct.Struct("<I")
+BINARY_MEDIA_TYPE = "application/octet-stream"
+
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=120, connect=10)
+
+
 class IndicParlerRESTTTSService(TTSService):
 
     def __init__(
@@ -44,8 +52,7 @@ class IndicParlerRESTTTSService(TTSService):
         # limit=0 means no limit on concurrent connections
         # ttl_dns_cache=300 caches DNS lookups for 5 minutes
         connector = aiohttp.TCPConnector(limit=0, ttl_dns_cache=300)
-        timeout = aiohttp.ClientTimeout(total=120, connect=10)
-        self._session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+        self._session = aiohttp.ClientSession(connector=connector, timeout=REQUEST_TIMEOUT)
         await super().start(frame)
 
     async def stop(self, frame: Frame):
@@ -64,7 +71,7 @@ class IndicParlerRESTTTSService(TTSService):
         should_close = False
         if not session or session.closed:
             logger.warning("TTS session not available, creating temporary session")
-            session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=120))
+            session = aiohttp.ClientSession(timeout=REQUEST_TIMEOUT)
             should_close = True
 
         try:
@@ -80,47 +87,27 @@ class IndicParlerRESTTTSService(TTSService):
             async with session.post(
                 self._server_url,
                 json=payload,
-                headers={"Accept": "application/x-ndjson"},
+                headers={"Accept": f"{BINARY_MEDIA_TYPE}, application/x-ndjson;q=0.9"},
             ) as response:
                 if response.status != 200:
                     yield ErrorFrame(f"Server error: {response.status}")
                     return
 
-                buffer = ""
-                async for chunk in response.content.iter_any():
-                    if not chunk:
-                        continue
-
-                    buffer += chunk.decode("utf-8")
-                    
-                    while "\n" in buffer:
-                        line, buffer = buffer.split("\n", 1)
-                        if not line.strip():
-                            continue
-
-                        try:
-                            data = json.loads(line)
-                        except json.JSONDecodeError:
-                            continue
-
-                        if "error" in data:
-                            yield ErrorFrame(data["error"])
-                            return
-
-                        if data.get("done"):
-                            break
-
-                        if "audio" in data:
-                            audio_bytes = base64.b64decode(data["audio"])
-                            logger.info(f"Audio chunk sent to Telephony: {len(audio_bytes)} bytes")
-                            yield TTSAudioRawFrame(
-                                audio=audio_bytes,
-                                sample_rate=data.get("sample_rate", self.sample_rate),
-                                num_channels=1,
-                            )
+                # Servers predating the binary format ignore Accept and send NDJSON
+                if response.content_type == BINARY_MEDIA_TYPE:
+                    frames = self._read_binary_stream(response)
+                else:
+                    frames = self._read_ndjson_stream(response)
+
+                async for frame in frames:
+                    yield frame
+                    if isinstance(frame, ErrorFrame):
+                        return
 
             yield TTSStoppedFrame()
 
+        except asyncio.IncompleteReadError as e:
+            yield ErrorFrame(f"TTS stream ended early ({len(e.partial)} of {e.expected} bytes)")
         except aiohttp.ClientError as e:
             yield ErrorFrame(f"Connection error: {e}")
         except asyncio.TimeoutError:
@@ -130,3 +117,60 @@ class IndicParlerRESTTTSService(TTSService):
         finally:
             if should_close and session:
                 await session.close()
+
+    async def _read_binary_stream(self, response: aiohttp.ClientResponse) -> AsyncGenerator[Frame, None]:
+        # Raw PCM frames after a one-line JSON header: no base64 hop
+        header = orjson.loads(await response.content.readline())
+        if "error" in header:
+            yield ErrorFrame(header["error"])
+            return
+        sample_rate = header.get("sample_rate", self.sample_rate)
+
+        while True:
+            prefix = await response.content.readexactly(FRAME_HEADER.size)
+            (size,) = FRAME_HEADER.unpack(prefix)
+            if not size:
+                break
+
+            audio_bytes = await response.content.readexactly(size)
+            logger.info(f"Audio chunk sent to Telephony: {len(audio_bytes)} bytes")
+            yield TTSAudioRawFrame(
+                audio=audio_bytes,
+                sample_rate=sample_rate,
+                num_channels=1,
+            )
+
+    async def _read_ndjson_stream(self, response: aiohttp.ClientResponse) -> AsyncGenerator[Frame, None]:
+        buffer = bytearray()
+        async for chunk in response.content.iter_any():
+            buffer.extend(chunk)
+            start = 0
+
+            while (end := buffer.find(b"\n", start)) != -1:
+                line = buffer[start:end]
+                start = end + 1
+                if not line.strip():
+                    continue
+
+                try:
+                    data = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    continue
+
+                if "error" in data:
+                    yield ErrorFrame(data["error"])
+                    return
+
+                if data.get("done"):
+                    return
+
+                if "audio" in data:
+                    audio_bytes = base64.b64decode(data["audio"])
+                    logger.info(f"Audio chunk sent to Telephony: {len(audio_bytes)} bytes")
+                    yield TTSAudioRawFrame(
+                        audio=audio_bytes,
+                        sample_rate=data.get("sample_rate", self.sample_rate),
+                        num_channels=1,
+                    )
+
+            del buffer[:start]
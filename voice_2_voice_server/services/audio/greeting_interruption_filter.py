@@ -9,6 +9,9 @@ from pipecat.frames.frames import (
 )
 from pipecat.processors.frame_processor import FrameDirection, FrameProcessor
 
+# Frame types (and their subclasses) dropped while the greeting plays
+_BLOCKED_FRAME_TYPES = (StartInterruptionFrame, InterruptionFrame, UserStartedSpeakingFrame)
+
 
 class GreetingInterruptionFilter(FrameProcessor):
     """Filters out interruption frames while the greeting is being played."""
@@ -24,12 +27,11 @@ class GreetingInterruptionFilter(FrameProcessor):
     async def process_frame(self, frame: Frame, direction: FrameDirection):
         await super().process_frame(frame, direction)
 
-        if isinstance(frame, BotStoppedSpeakingFrame) and self._greeting_in_progress:
-            self._greeting_in_progress = False
-            logger.debug("Greeting completed - interruptions enabled")
-
         if self._greeting_in_progress:
-            if isinstance(frame, (StartInterruptionFrame, InterruptionFrame, UserStartedSpeakingFrame)):
+            if isinstance(frame, BotStoppedSpeakingFrame):
+                self._greeting_in_progress = False
+                logger.debug("Greeting completed - interruptions enabled")
+            elif isinstance(frame, _BLOCKED_FRAME_TYPES):
                 logger.debug(f"Blocked {frame.__class__.__name__} during greeting")
                 return
 
@@ -2,6 +2,7 @@
 
 import asyncio
 import os
+import time
 from typing import AsyncGenerator, Optional
 from loguru import logger
 
@@ -27,10 +28,18 @@ except ModuleNotFoundError as e:
     logger.error("Install with: pip install python-socketio[asyncio_client] aiohttp")
     raise Exception(f"Missing module: {e}")
 
+# Coalesce ~20 ms input frames into one Socket.IO packet per interval
+EMIT_INTERVAL_SECS = 0.08
+EMIT_MAX_BYTES = 8192
+
 
 class BhashiniSTTService(STTService):
     """Bhashini real-time STT using Socket.IO."""
 
+    # "data" event args: (audio, config, clear_server_state, is_stream_inactive)
+    _FINALIZE_ARGS = (None, None, True, False)
+    _END_OF_STREAM_ARGS = (None, None, True, True)
+
     def __init__(
         self,
         *,
@@ -49,6 +58,7 @@ class BhashiniSTTService(STTService):
         self._service_id = service_id
         self._language = language
         self._response_frequency_secs = response_frequency_secs
+        self._start_args_cache: Optional[tuple] = None
 
         self._sio: Optional[socketio.AsyncClient] = None
         
@@ -56,6 +66,20 @@ class BhashiniSTTService(STTService):
         self._is_ready = False
         self._is_speaking = False
         self._ready_event: Optional[asyncio.Event] = None
+        self._last_interim = ""
+
+        self._emit_buf: list[bytes] = []
+        self._emit_buf_bytes = 0
+        self._last_flush = time.monotonic()
+
+    def _start_args(self) -> tuple:
+        """Payload for the "start" event, built once per service/language."""
+        if self._start_args_cache is None:
+            self._start_args_cache = (
+                self._build_task_sequence(),
+                {"responseFrequencyInSecs": self._response_frequency_secs},
+            )
+        return self._start_args_cache
 
     def _build_task_sequence(self) -> list:
         return [{
@@ -91,10 +115,7 @@ class BhashiniSTTService(STTService):
         async def connect():
             logger.debug(f"Bhashini socket connected: {self._sio.get_sid()}")
             self._is_connected = True
-            await self._sio.emit("start", (
-                self._build_task_sequence(),
-                {"responseFrequencyInSecs": self._response_frequency_secs}
-            ))
+            await self._sio.emit("start", self._start_args())
 
         @self._sio.event
         async def connect_error(data):
@@ -109,7 +130,10 @@ class BhashiniSTTService(STTService):
 
         @self._sio.on("response")
         async def on_response(response, streaming_status):
-            await self._handle_response(response, streaming_status)
+            if streaming_status.get("isIntermediateResult", True):
+                await self._handle_interim(response)
+            else:
+                await self._handle_final(response)
 
         @self._sio.on("abort")
         async def on_abort(message):
@@ -131,7 +155,7 @@ class BhashiniSTTService(STTService):
         try:
             await self._sio.connect(
                 url=self._socket_url,
-                transports=["websocket", "polling"],
+                transports=["websocket"],
                 socketio_path="/socket.io",
                 auth={"authorization": self._api_key}
             )
@@ -149,63 +173,93 @@ class BhashiniSTTService(STTService):
             logger.debug("Disconnecting from Bhashini")
             self._is_ready = False
             self._is_connected = False
+            self._emit_buf.clear()
+            self._emit_buf_bytes = 0
             try:
                 await self._sio.disconnect()
             except Exception as e:
                 logger.warning(f"Disconnect error: {e}")
             self._sio = None
 
+    async def _flush_audio(self):
+        """Send buffered audio frames as a single data packet."""
+        if not self._emit_buf:
+            return
+        audio = b"".join(self._emit_buf)
+        self._emit_buf.clear()
+        self._emit_buf_bytes = 0
+        self._last_flush = time.monotonic()
+        await self._sio.emit("data", (
+            {"audio": [{"audioContent": audio}]},
+            {},
+            False,  # clear_server_state
+            False   # is_stream_inactive
+        ))
+
     async def _send_end_of_stream(self):
         """Signal end of speech to server - triggers final transcription."""
         if not self._sio or not self._is_connected:
             return
         try:
+            await self._flush_audio()
             # clear_server_state=True tells server speaking stopped
-            await self._sio.emit("data", (None, None, True, False))
-            await self._sio.emit("data", (None, None, True, True))
+            await self._sio.emit("data", self._FINALIZE_ARGS)
+            await self._sio.emit("data", self._END_OF_STREAM_ARGS)
             logger.debug("Sent end of stream signal")
         except Exception as e:
             logger.warning(f"End of stream error: {e}")
 
-    async def _handle_response(self, response: dict, streaming_status: dict):
-        """Process transcription response from Bhashini."""
+    @staticmethod
+    def _response_outputs(response: dict) -> list:
+        """ASR output chunks of a Bhashini response, or an empty list."""
+        pipeline_response = response.get("pipelineResponse")
+        if not pipeline_response:
+            return []
+        return pipeline_response[0].get("output") or []
+
+    async def _handle_interim(self, response: dict):
+        """Push the latest partial transcript if it changed."""
         try:
-            is_interim = streaming_status.get("isIntermediateResult", True)
-            
-            pipeline_response = response.get("pipelineResponse", [])
-            if not pipeline_response:
-                return
-            
-            outputs = pipeline_response[0].get("output", [])
+            outputs = self._response_outputs(response)
             if not outputs:
                 return
 
-            if is_interim:
-                transcript = outputs[0].get("source", "")
-            else:
-                transcript = ". ".join(
-                    chunk.get("source", "")
-                    for chunk in outputs
-                    if chunk.get("source", "").strip()
-                )
+            transcript = outputs[0].get("source", "")
+            # Server re-sends the same partial every response interval
+            if not transcript.strip() or transcript == self._last_interim:
+                return
+            self._last_interim = transcript
 
-            if not transcript.strip():
+            logger.debug(f"Bhashini interim: {transcript}")
+            await self.push_frame(InterimTranscriptionFrame(
+                text=transcript,
+                user_id=self._user_id,
+                timestamp=time_now_iso8601(),
+            ))
+
+        except Exception as e:
+            logger.error(f"Response handling error: {e}")
+
+    async def _handle_final(self, response: dict):
+        """Join all final output chunks into one transcription."""
+        try:
+            outputs = self._response_outputs(response)
+            if not outputs:
                 return
 
-            if is_interim:
-                logger.debug(f"Bhashini interim: {transcript}")
-                await self.push_frame(InterimTranscriptionFrame(
-                    text=transcript,
-                    user_id=self._user_id,
-                    timestamp=time_now_iso8601(),
-                ))
-            else:
-                logger.info(f"Bhashini final: {transcript}")
-                await self.push_frame(TranscriptionFrame(
-                    text=transcript,
-                    user_id=self._user_id,
-                    timestamp=time_now_iso8601(),
-                ))
+            transcript = ". ".join(
+                filter(str.strip, (chunk.get("source", "") for chunk in outputs))
+            )
+            if not transcript:
+                return
+            self._last_interim = ""
+
+            logger.info(f"Bhashini final: {transcript}")
+            await self.push_frame(TranscriptionFrame(
+                text=transcript,
+                user_id=self._user_id,
+                timestamp=time_now_iso8601(),
+            ))
 
         except Exception as e:
             logger.error(f"Response handling error: {e}")
@@ -216,13 +270,17 @@ class BhashiniSTTService(STTService):
             yield None
             return
 
+        self._emit_buf.append(audio)
+        self._emit_buf_bytes += len(audio)
+        if (
+            self._emit_buf_bytes < EMIT_MAX_BYTES
+            and time.monotonic() - self._last_flush < EMIT_INTERVAL_SECS
+        ):
+            yield None
+            return
+
         try:
-            await self._sio.emit("data", (
-                {"audio": [{"audioContent": audio}]},
-                {},
-                False,  # clear_server_state
-                False   # is_stream_inactive
-            ))
+            await self._flush_audio()
         except Exception as e:
             logger.error(f"Audio send error: {e}")
             yield ErrorFrame(error=str(e))
@@ -244,19 +302,22 @@ class BhashiniSTTService(STTService):
             # Like Deepgram's finalize() - tell server to flush and send final result
             if self._sio and self._is_ready:
                 try:
-                    await self._sio.emit("data", (None, None, True, False))
+                    await self._flush_audio()
+                    await self._sio.emit("data", self._FINALIZE_ARGS)
                 except Exception as e:
                     logger.error(f"Finalize signal error: {e}")
 
     async def set_language(self, language: str):
         logger.info(f"Switching language to: {language}")
         self._language = language
+        self._start_args_cache = None
         await self._disconnect()
         await self._connect()
 
     async def set_model(self, service_id: str):
         logger.info(f"Switching service to: {service_id}")
         self._service_id = service_id
+        self._start_args_cache = None
         await self._disconnect()
         await self._connect()
 
@@ -1,10 +1,10 @@
 import asyncio
 import base64
-import json
 import os
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 
 import aiohttp
+import orjson
 from pipecat.frames.frames import (
     ErrorFrame,
     Frame,
@@ -16,6 +16,9 @@ from pipecat.services.tts_service import TTSService
 
 from loguru import logger
 
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=120, connect=10)
+
+
 class BhashiniTTSService(TTSService):
 
     def __init__(
@@ -40,71 +43,99 @@ class BhashiniTTSService(TTSService):
         self._speaker = speaker
         self._description = description
         self._play_steps_in_s = play_steps_in_s
-        self._play_steps_in_s = play_steps_in_s
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def start(self, frame: Frame):
+        logger.info("Starting Bhashini TTS service")
+        # One keep-alive session per service so each utterance skips the
+        # TCP + TLS handshake to the TTS server
+        connector = aiohttp.TCPConnector(limit=32, ttl_dns_cache=300, keepalive_timeout=60)
+        self._session = aiohttp.ClientSession(connector=connector, timeout=REQUEST_TIMEOUT)
+        await super().start(frame)
+
+    async def stop(self, frame: Frame):
+        logger.info("Stopping Bhashini TTS service")
+        await self._close_session()
+        await super().stop(frame)
+
+    async def cancel(self, frame: Frame):
+        await self._close_session()
+        await super().cancel(frame)
+
+    async def _close_session(self):
+        if self._session:
+            await self._session.close()
+            self._session = None
 
     async def run_tts(self, text: str) -> AsyncGenerator[Frame, None]:
         if not text.strip():
             return
 
-        timeout = aiohttp.ClientTimeout(total=120)
+        # Use persistent session if available, otherwise fall back to temporary (safety)
+        session = self._session
+        should_close = False
+        if not session or session.closed:
+            logger.warning("TTS session not available, creating temporary session")
+            session = aiohttp.ClientSession(timeout=REQUEST_TIMEOUT)
+            should_close = True
 
         try:
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                payload = {
-                    "text": text,
-                    "description": self._description,
-                    "speaker": self._speaker,
-                    "play_steps_in_s": self._play_steps_in_s,
-                }
-
-                yield TTSStartedFrame()
-
-                async with session.post(
-                    self._server_url,
-                    json=payload,
-                    headers={
-                        "Accept": "application/x-ndjson",
-                        "Authorization": f"Bearer {self._auth_token}",
-                    },
-                ) as response:
-                    if response.status != 200:
-                        yield ErrorFrame(f"Server error: {response.status}")
-                        return
-
-                    buffer = ""
-                    async for chunk in response.content.iter_any():
-                        if not chunk:
+            payload = {
+                "text": text,
+                "description": self._description,
+                "speaker": self._speaker,
+                "play_steps_in_s": self._play_steps_in_s,
+            }
+
+            yield TTSStartedFrame()
+
+            async with session.post(
+                self._server_url,
+                json=payload,
+                headers={
+                    "Accept": "application/x-ndjson",
+                    "Authorization": f"Bearer {self._auth_token}",
+                },
+            ) as response:
+                if response.status != 200:
+                    yield ErrorFrame(f"Server error: {response.status}")
+                    return
+
+                buffer = bytearray()
+                async for chunk in response.content.iter_any():
+                    buffer.extend(chunk)
+                    start = 0
+
+                    while (end := buffer.find(b"\n", start)) != -1:
+                        line = buffer[start:end]
+                        start = end + 1
+                        if not line.strip():
                             continue
 
-                        buffer += chunk.decode("utf-8")
-                        
-                        while "\n" in buffer:
-                            line, buffer = buffer.split("\n", 1)
-                            if not line.strip():
-                                continue
+                        try:
+                            data = orjson.loads(line)
+                        except orjson.JSONDecodeError:
+                            continue
 
-                            try:
-                                data = json.loads(line)
-                            except json.JSONDecodeError:
-                                continue
+                        if "error" in data:
+                            yield ErrorFrame(data["error"])
+                            return
 
-                            if "error" in data:
-                                yield ErrorFrame(data["error"])
-                                return
+                        if data.get("done"):
+                            break
 
-                            if data.get("done"):
-                                break
+                        if "audio" in data:
+                            audio_bytes = base64.b64decode(data["audio"])
+                            logger.info(f"Audio chunk sent to Telephony: {len(audio_bytes)} bytes")
+                            yield TTSAudioRawFrame(
+                                audio=audio_bytes,
+                                sample_rate=data.get("sample_rate", self.sample_rate),
+                                num_channels=1,
+                            )
 
-                            if "audio" in data:
-                                audio_bytes = base64.b64decode(data["audio"])
-                                logger.info(f"Audio chunk sent to Telephony: {len(audio_bytes)} bytes")
-                                yield TTSAudioRawFrame(
-                                    audio=audio_bytes,
-                                    sample_rate=data.get("sample_rate", self.sample_rate),
-                                    num_channels=1,
-                                )
+                    del buffer[:start]
 
-                yield TTSStoppedFrame()
+            yield TTSStoppedFrame()
 
         except aiohttp.ClientError as e:
             yield ErrorFrame(f"Connection error: {e}")
@@ -112,3 +143,6 @@ class BhashiniTTSService(TTSService):
             yield ErrorFrame("Request timeout")
         except Exception as e:
             yield ErrorFrame(f"TTS error: {e}")
+        finally:
+            if should_close and session:
+                await session.close()
@@ -1,12 +1,51 @@
 from loguru import logger
 from pipecat.services.openai.llm import OpenAILLMService
-from pipecat.frames.frames import LLMTextFrame, TTSSpeakFrame
+from pipecat.frames.frames import CancelFrame, EndFrame, LLMTextFrame, TTSSpeakFrame
 from pipecat.processors.aggregators.openai_llm_context import OpenAILLMContext
 from pipecat.processors.aggregators.llm_context import LLMContext
 import aiohttp
 import asyncio
+import codecs
+import re
+import uuid
+from itertools import cycle, islice
 from typing import Optional
 
+# Max number of trailing context messages searched for the latest user turn
+USER_MESSAGE_SCAN_LIMIT = 20
+
+# A streamed word followed by its space/newline separator(s)
+_WORD_RE = re.compile(r"([^ \n]+)[ \n]+")
+_utf8_decoder = codecs.getincrementaldecoder("utf-8")
+
+VISTAAR_BASE_URL = "https://vistaar-dev.mahapocra.gov.in"
+_VISTAAR_URL = f"{VISTAAR_BASE_URL}/api/voice/"  # ✅ WITH trailing slash
+
+# Vistaar is a single hot host shared by every concurrent call
+VISTAAR_CONNECTOR_LIMIT = 200
+VISTAAR_CONNECTOR_LIMIT_PER_HOST = 64
+# Fail fast on a dead connect and on a stalled stream instead of wedging a pooled socket
+VISTAAR_TIMEOUT = aiohttp.ClientTimeout(total=60, sock_connect=3, sock_read=30)
+
+# Streamed words are coalesced into LLMTextFrames of roughly this many chars
+LLM_TEXT_BATCH_CHARS = 24
+# A word ending in one of these flushes the batch immediately (incl. Devanagari danda)
+_SENTENCE_END = (".", "!", "?", "।")
+
+# Upper bound on waiting for a cancelled hold-message task to unwind
+HOLD_CANCEL_TIMEOUT_SECS = 1.0
+
+
+async def _cancel_bounded(task: asyncio.Task, timeout: float = HOLD_CANCEL_TIMEOUT_SECS):
+    """Cancel task and wait for it, but never block cleanup longer than timeout."""
+    task.cancel()
+    # asyncio.wait neither raises the task's CancelledError nor re-waits
+    # after the timeout, so a cancellation of the caller still propagates
+    done, _ = await asyncio.wait({task}, timeout=timeout)
+    if task not in done:
+        logger.warning(f"⚠️ Hold message task did not stop within {timeout}s")
+
+
 class KenpathLLM(OpenAILLMService):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -19,24 +58,45 @@ class KenpathLLM(OpenAILLMService):
                 "कृपया प्रतीक्षा करा, मी उत्तर शोधत आहे",    # Message 3: Please wait, I'm searching for the answer
                 "थोडा वेळ द्या, मी माहिती मिळवत आहे"
     ]
-        self.hold_message_index = 0  # Track which message to play next
+        self._hold_messages = cycle(enumerate(self.hold_messages))  # Rotates 0 → 1 → 2 → 3 → 0...
+
+        # Created on first request and reused so turns share keep-alive connections
+        self._http: Optional[aiohttp.ClientSession] = None
         
         logger.info(f"🤖 KenpathLLM initialized with {self.response_timeout}s timeout")
         logger.info(f"📢 Loaded {len(self.hold_messages)} rotating hold messages")
     
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        if self._http is None or self._http.closed:
+            connector = aiohttp.TCPConnector(
+                limit=VISTAAR_CONNECTOR_LIMIT,
+                limit_per_host=VISTAAR_CONNECTOR_LIMIT_PER_HOST,
+                ttl_dns_cache=600,
+                keepalive_timeout=75,
+            )
+            self._http = aiohttp.ClientSession(connector=connector, timeout=VISTAAR_TIMEOUT)
+        return self._http
+
+    async def _close_http_session(self):
+        if self._http:
+            await self._http.close()
+            self._http = None
+
+    async def stop(self, frame: EndFrame):
+        await super().stop(frame)
+        await self._close_http_session()
+
+    async def cancel(self, frame: CancelFrame):
+        await super().cancel(frame)
+        await self._close_http_session()
+
     def _get_hold_message(self):
         """
         Get next hold message and rotate to the next one.
         Cycles through all 4 messages: 0 → 1 → 2 → 3 → 0 → 1...
         """
-        msg = self.hold_messages[self.hold_message_index]
-        
-        # Move to next message (with wraparound)
-        self.hold_message_index = (self.hold_message_index + 1) % len(self.hold_messages)
-        
-        logger.debug(f"🔄 Selected hold message #{self.hold_message_index}: '{msg}'")
-        logger.debug(f"📌 Next message will be #{self.hold_message_index + 1 if self.hold_message_index < len(self.hold_messages) - 1 else 0}")
-        
+        index, msg = next(self._hold_messages)
+        logger.debug("🔄 Selected hold message #{}: '{}'", index, msg)
         return msg
     
     async def _process_context(self, context: OpenAILLMContext | LLMContext):
@@ -54,12 +114,18 @@ class KenpathLLM(OpenAILLMService):
         )
         
         # Extract user message from context
+        # The latest user turn is always near the tail, so only scan the last few
         messages = context.get_messages()
-        user_message = ""
-        for message in reversed(messages):
-            if message.get("role") == "user":
-                user_message = message.get("content", "")
-                break
+        user_message = next(
+            (
+                content.strip()
+                for message in islice(reversed(messages), USER_MESSAGE_SCAN_LIMIT)
+                if message.get("role") == "user"
+                and isinstance(content := message.get("content"), str)
+                and content.strip()
+            ),
+            "",
+        )
         
         if not user_message:
             logger.warning("⚠️ No user message found in context")
@@ -102,6 +168,11 @@ class KenpathLLM(OpenAILLMService):
             first_chunk = True
             chunk_count = 0
             
+            # Coalesce words so each frame hop through the pipeline carries a
+            # phrase; TTS aggregates to sentences anyway, so latency is unchanged
+            pending = []
+            pending_len = 0
+            
             # Stream response from Vistaar API
             async for chunk in self._stream_vistaar_completions(user_message):
                 
@@ -111,17 +182,24 @@ class KenpathLLM(OpenAILLMService):
                     
                     if hold_message_task and not hold_message_task.done():
                         logger.info("🚀 First LLM chunk received - cancelling hold message")
-                        hold_message_task.cancel()
-                        try:
-                            await hold_message_task
-                        except asyncio.CancelledError:
-                            pass  # Expected cancellation
+                        await _cancel_bounded(hold_message_task)
                     else:
                         logger.info("🚀 First LLM chunk received (hold message already played/playing)")
                 
+                pending.append(chunk)
+                pending_len += len(chunk)
+                if pending_len < LLM_TEXT_BATCH_CHARS and not chunk.rstrip().endswith(_SENTENCE_END):
+                    continue
+                
                 # Push LLM response chunk
                 # If hold message was queued, TTS will finish it first, then play this
-                await self.push_frame(LLMTextFrame(text=chunk))
+                await self.push_frame(LLMTextFrame(text="".join(pending)))
+                chunk_count += 1
+                pending.clear()
+                pending_len = 0
+            
+            if pending:
+                await self.push_frame(LLMTextFrame(text="".join(pending)))
                 chunk_count += 1
             
             logger.info(f"✅ Streamed {chunk_count} chunks from LLM")
@@ -131,29 +209,21 @@ class KenpathLLM(OpenAILLMService):
             
             # Cancel hold message on error
             if hold_message_task and not hold_message_task.done():
-                hold_message_task.cancel()
-                try:
-                    await hold_message_task
-                except asyncio.CancelledError:
-                    pass
+                await _cancel_bounded(hold_message_task)
             raise
         
         finally:
             # Ensure hold message task is always cleaned up
             if hold_message_task and not hold_message_task.done():
                 logger.debug("🧹 Cleaning up hold message task")
-                hold_message_task.cancel()
-                try:
-                    await hold_message_task
-                except asyncio.CancelledError:
-                    pass
+                await _cancel_bounded(hold_message_task)
             
             logger.debug("✅ _process_context completed")
     
     async def _stream_vistaar_completions(
             self,
             query: str,
-            base_url: str = "https://vistaar-dev.mahapocra.gov.in",
+            base_url: str = VISTAAR_BASE_URL,
             source_lang: str = "mr",
             target_lang: str = "mr",
             session_id: Optional[str] = None
@@ -171,8 +241,7 @@ class KenpathLLM(OpenAILLMService):
             Yields:
                 str: Words from the LLM response with trailing space
             """
-            import uuid
-            url = f"{base_url}/api/voice/"  # ✅ WITH trailing slash
+            url = _VISTAAR_URL if base_url == VISTAAR_BASE_URL else f"{base_url}/api/voice/"
             session_id = session_id or str(uuid.uuid4())
             
             # ✅ WITH underscores (matching working curl command)
@@ -187,63 +256,52 @@ class KenpathLLM(OpenAILLMService):
     
             logger.debug(f"Parameters: {params}")
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url, 
-                    params=params, 
-                    timeout=aiohttp.ClientTimeout(total=60)
-                ) as response:
-                    
-                    if response.status != 200:
-                        error_text = await response.text()
-                        logger.error(f"❌ Vistaar API error {response.status}: {error_text}")
-                        raise Exception(f"Vistaar API Error {response.status}: {error_text}")
-                    
-                    logger.info("✅ Connected to Vistaar API, streaming response...")
-                    
-                    buffer = ""
-                    word_count = 0
+            async with self._get_http_session().get(url, params=params) as response:
+                
+                if response.status != 200:
+                    error_text = await response.text()
+                    logger.error(f"❌ Vistaar API error {response.status}: {error_text}")
+                    raise Exception(f"Vistaar API Error {response.status}: {error_text}")
+                
+                logger.info("✅ Connected to Vistaar API, streaming response...")
+                
+                buffer = ""
+                word_count = 0
+                
+                # Devanagari code points can straddle chunk boundaries; the
+                # incremental decoder holds partial sequences until complete
+                decoder = _utf8_decoder(errors="ignore")
+                
+                async for data in response.content.iter_any():
+                    decoded_chunk = decoder.decode(data)
+                    if not decoded_chunk:
+                        continue
+                    buffer += decoded_chunk
                     
-                    async for data in response.content.iter_any():
-                        try:
-                            decoded_chunk = data.decode('utf-8')
-                            buffer += decoded_chunk
+                    # Emit every complete word in one pass; keep the trailing partial word
+                    pos = 0
+                    for match in _WORD_RE.finditer(buffer):
+                        pos = match.end()
+                        word = match.group(1).strip()
+                        
+                        if word:
+                            word_count += 1
+                            if word_count == 1:
+                                logger.info(f"📝 First word received: '{word}'")
+                            elif word_count % 10 == 0:
+                                logger.debug(f"📝 Streamed {word_count} words...")
                             
-                            # Split on spaces and newlines
-                            while ' ' in buffer or '\n' in buffer:
-                                space_idx = buffer.find(' ')
-                                newline_idx = buffer.find('\n')
-                                
-                                if space_idx == -1:
-                                    split_idx = newline_idx
-                                elif newline_idx == -1:
-                                    split_idx = space_idx
-                                else:
-                                    split_idx = min(space_idx, newline_idx)
-                                
-                                if split_idx == -1:
-                                    break
-                                
-                                word = buffer[:split_idx].strip()
-                                buffer = buffer[split_idx + 1:]
-                                
-                                if word:
-                                    word_count += 1
-                                    if word_count == 1:
-                                        logger.info(f"📝 First word received: '{word}'")
-                                    elif word_count % 10 == 0:
-                                        logger.debug(f"📝 Streamed {word_count} words...")
-                                    
-                                    yield word + " "
-                                    
-                        except UnicodeDecodeError:
-                            logger.warning("⚠️ Unicode decode error in chunk, skipping")
-                            continue
+                            yield word + " "
                     
-                    # Yield any remaining content in buffer
-                    if buffer.strip():
-                        word_count += 1
-                        logger.debug(f"📝 Final chunk: '{buffer.strip()}'")
-                        yield buffer.strip()
-                    
-                    logger.info(f"✅ Vistaar API streaming complete. Total words: {word_count}")
+                    if pos:
+                        buffer = buffer[pos:]
+                
+                buffer += decoder.decode(b"", final=True)
+                
+                # Yield any remaining content in buffer
+                if buffer.strip():
+                    word_count += 1
+                    logger.debug(f"📝 Final chunk: '{buffer.strip()}'")
+                    yield buffer.strip()
+                
+                logger.info(f"✅ Vistaar API streaming complete. Total words: {word_count}")
@@ -2,11 +2,62 @@
 import asyncio
 import io
 import os
-import wave
+import struct
+from typing import Optional
+
 from minio import Minio
-from minio.error import S3Error
+from minio.deleteobjects import DeleteObject
 from loguru import logger
 
+# append_transcript flushes a call's buffered lines at whichever comes first
+TRANSCRIPT_FLUSH_LINES = 20
+TRANSCRIPT_FLUSH_SECS = 2.0
+
+
+# (endpoint, bucket) pairs already verified in this process; each call
+# builds its own MinIOStorage, so the check must outlive the instance
+_BUCKETS_ENSURED: set[tuple[str, str]] = set()
+
+
+_WAV_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+
+
+def _wav_header(data_size: int, sample_rate: int, num_channels: int) -> bytes:
+    """Build the 44-byte RIFF header for PCM16 audio of data_size bytes."""
+    block_align = num_channels * 2
+    return _WAV_HEADER.pack(
+        b"RIFF", 36 + data_size, b"WAVE",
+        b"fmt ", 16, 1, num_channels, sample_rate, sample_rate * block_align, block_align, 16,
+        b"data", data_size,
+    )
+
+
+class _ChunkStream(io.RawIOBase):
+    """Read-only file object over a list of byte chunks, without joining them."""
+
+    def __init__(self, chunks: list):
+        self._chunks = iter(chunks)
+        self._current = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        filled = 0
+        size = len(buffer)
+        while filled < size:
+            if not self._current:
+                chunk = next(self._chunks, None)
+                if chunk is None:
+                    break
+                self._current = memoryview(chunk).cast("B")
+                continue
+            n = min(size - filled, len(self._current))
+            buffer[filled:filled + n] = self._current[:n]
+            self._current = self._current[n:]
+            filled += n
+        return filled
+
 
 def _get_env_or_raise(key: str) -> str:
     """Get environment variable or raise ValueError."""
@@ -38,12 +89,19 @@ class MinIOStorage:
             secret_key: MinIO secret key
             secure: Whether to use secure connection (HTTPS)
         """
+        self._endpoint = endpoint
         self.client = Minio(
             endpoint,
             access_key=access_key,
             secret_key=secret_key,
             secure=secure,
         )
+        # Per-call write-behind state for append_transcript
+        self._transcript_buffers: dict[str, list[str]] = {}
+        self._transcript_seq: dict[str, int] = {}
+        self._transcript_locks: dict[str, asyncio.Lock] = {}
+        self._flush_handles: dict[str, asyncio.TimerHandle] = {}
+        self._flush_tasks: set[asyncio.Task] = set()
         self._ensure_buckets()
     
     @classmethod
@@ -55,6 +113,7 @@ class MinIOStorage:
         - MINIO_ACCESS_KEY (required)
         - MINIO_SECRET_KEY (required)
         - MINIO_SECURE (optional, defaults to False)
+        - MINIO_SKIP_BUCKET_CHECK (optional, skips bucket provisioning checks)
         
         Returns:
             MinIOStorage instance configured from environment variables
@@ -75,69 +134,175 @@ class MinIOStorage:
         )
 
     def _ensure_buckets(self):
-        """Create buckets if they don't exist."""
+        """Create buckets if they don't exist (checked once per process)."""
+        if os.getenv("MINIO_SKIP_BUCKET_CHECK", "false").lower() in ("true", "1", "yes"):
+            return
         for bucket in ["recordings", "transcripts"]:
+            key = (self._endpoint, bucket)
+            if key in _BUCKETS_ENSURED:
+                continue
             if not self.client.bucket_exists(bucket):
                 self.client.make_bucket(bucket)
                 logger.info(f"Created bucket: {bucket}")
+            _BUCKETS_ENSURED.add(key)
 
     async def save_recording(self, call_sid: str, audio_data: bytes, sample_rate: int, num_channels: int) -> str:
         """Save audio recording to MinIO."""
-        buffer = io.BytesIO()
-        with wave.open(buffer, "wb") as wf:
-            wf.setnchannels(num_channels)
-            wf.setsampwidth(2)
-            wf.setframerate(sample_rate)
-            wf.writeframes(audio_data)
-        
-        buffer.seek(0)
+        return await self._put_recording(call_sid, [audio_data], len(audio_data), sample_rate, num_channels)
+
+    async def _put_recording(
+        self,
+        call_sid: str,
+        audio_chunks: list,
+        data_size: int,
+        sample_rate: int,
+        num_channels: int
+    ) -> str:
+        """Upload header + PCM chunks as a WAV without joining them in memory."""
+        header = _wav_header(data_size, sample_rate, num_channels)
+        stream = _ChunkStream([header, *audio_chunks])
         object_name = f"{call_sid}.wav"
-        buffer_size = buffer.getbuffer().nbytes
         
         # Run blocking MinIO operation in thread pool to avoid blocking event loop
         await asyncio.to_thread(
             self.client.put_object,
             bucket_name="recordings",
             object_name=object_name,
-            data=buffer,
-            length=buffer_size,
+            data=stream,
+            length=len(header) + data_size,
             content_type="audio/wav",
         )
         logger.info(f"Saved recording: minio://recordings/{object_name}")
         return object_name
 
     async def append_transcript(self, call_sid: str, line: str) -> str:
-        """Append line to transcript file."""
-        object_name = f"{call_sid}.txt"
+        """Buffer a transcript line for a later batched write.
+        
+        Lines are written as one part object under ``{call_sid}/`` once
+        ``TRANSCRIPT_FLUSH_LINES`` accumulate or ``TRANSCRIPT_FLUSH_SECS``
+        pass, whichever comes first. ``{call_sid}.txt`` itself is only
+        written by ``finalize_transcript``, which must run at call end
+        (bot.py does this in its teardown); until then buffered lines live
+        only in this process.
+        
+        Returns:
+            Object name the transcript will be assembled into
+        """
+        lines = self._transcript_buffers.setdefault(call_sid, [])
+        lines.append(line)
         
-        # Read existing content (if any) in thread pool
-        existing = ""
-        try:
-            response = await asyncio.to_thread(
-                self.client.get_object,
-                "transcripts",
-                object_name
+        if len(lines) >= TRANSCRIPT_FLUSH_LINES:
+            await self.flush_transcript(call_sid)
+        elif call_sid not in self._flush_handles:
+            self._flush_handles[call_sid] = asyncio.get_running_loop().call_later(
+                TRANSCRIPT_FLUSH_SECS, self._schedule_flush, call_sid
             )
-            existing = response.read().decode("utf-8")
-            response.close()
-            response.release_conn()
-        except S3Error as e:
-            if e.code != "NoSuchKey":
+        return f"{call_sid}.txt"
+
+    def _schedule_flush(self, call_sid: str):
+        self._flush_handles.pop(call_sid, None)
+        task = asyncio.create_task(self.flush_transcript(call_sid))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._on_flush_done)
+
+    def _on_flush_done(self, task: asyncio.Task):
+        self._flush_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            # Lines were re-buffered by flush_transcript; the next flush retries them
+            logger.error(f"Timed transcript flush failed: {task.exception()}")
+
+    async def flush_transcript(self, call_sid: str) -> Optional[str]:
+        """Write buffered transcript lines for a call as one part object.
+        
+        Args:
+            call_sid: Call identifier
+            
+        Returns:
+            Object name of the written part, or None if nothing was buffered
+        """
+        handle = self._flush_handles.pop(call_sid, None)
+        if handle:
+            handle.cancel()
+        
+        lock = self._transcript_locks.setdefault(call_sid, asyncio.Lock())
+        async with lock:
+            lines = self._transcript_buffers.pop(call_sid, None)
+            if not lines:
+                return None
+            
+            seq = self._transcript_seq.get(call_sid, 0)
+            self._transcript_seq[call_sid] = seq + 1
+            object_name = f"{call_sid}/{seq:06d}.txt"
+            data = ("\n".join(lines) + "\n").encode("utf-8")
+            
+            try:
+                await asyncio.to_thread(
+                    self.client.put_object,
+                    bucket_name="transcripts",
+                    object_name=object_name,
+                    data=io.BytesIO(data),
+                    length=len(data),
+                    content_type="text/plain",
+                )
+            except Exception:
+                # Keep the lines (ahead of any appended meanwhile) for the next flush
+                self._transcript_buffers[call_sid] = lines + self._transcript_buffers.get(call_sid, [])
+                self._transcript_seq[call_sid] = seq
                 raise
+            return object_name
+
+    async def finalize_transcript(self, call_sid: str) -> Optional[str]:
+        """Assemble appended transcript parts into a single transcript file.
         
-        content = existing + line + "\n"
-        data = content.encode("utf-8")
-        data_buffer = io.BytesIO(data)
+        Args:
+            call_sid: Call identifier
+            
+        Returns:
+            Object name of saved transcript, or None if nothing was appended
+        """
+        if call_sid not in self._transcript_buffers and call_sid not in self._transcript_seq:
+            # append_transcript was never used for this call: no parts to assemble
+            return None
+        await self.flush_transcript(call_sid)
+        self._transcript_seq.pop(call_sid, None)
+        self._transcript_locks.pop(call_sid, None)
+        return await asyncio.to_thread(self._finalize_transcript_sync, call_sid)
+
+    def _finalize_transcript_sync(self, call_sid: str) -> Optional[str]:
+        part_names = sorted(
+            obj.object_name
+            for obj in self.client.list_objects("transcripts", prefix=f"{call_sid}/")
+        )
+        if not part_names:
+            logger.warning(f"No transcript parts to finalize for {call_sid}")
+            return None
         
-        # Write updated content in thread pool
-        await asyncio.to_thread(
-            self.client.put_object,
+        parts = []
+        for part_name in part_names:
+            response = self.client.get_object("transcripts", part_name)
+            try:
+                parts.append(response.read())
+            finally:
+                response.close()
+                response.release_conn()
+        
+        data = b"".join(parts)
+        object_name = f"{call_sid}.txt"
+        self.client.put_object(
             bucket_name="transcripts",
             object_name=object_name,
-            data=data_buffer,
+            data=io.BytesIO(data),
             length=len(data),
             content_type="text/plain",
         )
+        
+        # remove_objects is lazy; iterating it performs the delete
+        for error in self.client.remove_objects(
+            "transcripts", [DeleteObject(name) for name in part_names]
+        ):
+            logger.warning(f"Failed to delete transcript part {error.name}: {error}")
+        
+        logger.info(f"Saved transcript: minio://transcripts/{object_name}")
         return object_name
     
     async def save_recording_from_chunks(
@@ -162,11 +327,9 @@ class MinIOStorage:
             logger.warning(f"No audio chunks to save for {call_sid}")
             return None
         
-        # Concatenate all audio chunks
-        audio_data = b''.join(audio_chunks)
-        
-        # Save as single WAV file
-        return await self.save_recording(call_sid, audio_data, sample_rate, num_channels)
+        # Stream chunks straight into the upload; never hold a joined copy
+        data_size = sum(len(chunk) for chunk in audio_chunks)
+        return await self._put_recording(call_sid, audio_chunks, data_size, sample_rate, num_channels)
     
     async def save_transcript_from_lines(self, call_sid: str, transcript_lines: list) -> str:
         """Save complete transcript from accumulated lines.
@@ -2,9 +2,11 @@
 Authentication utilities for JWT token generation and verification.
 """
 import os
-from datetime import datetime, timedelta
+import time
+from datetime import timedelta
+from functools import lru_cache
 from typing import Optional, Dict, Any
-from jose import JWTError, jwt
+import jwt
 import bcrypt
 from fastapi import Depends, HTTPException, status, Header
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
@@ -16,6 +18,7 @@ logger = logging.getLogger(__name__)
 
 # Internal API Key for service-to-service communication
 INTERNAL_API_KEY = os.getenv("INTERNAL_API_KEY", "")
+_INTERNAL_API_KEY_BYTES = INTERNAL_API_KEY.encode("utf-8")
 
 # JWT settings
 # SECRET_KEY should be set in .env file for production
@@ -25,6 +28,10 @@ if not SECRET_KEY:
     logger.warning("SECRET_KEY not set in environment. Generating a temporary key. Set SECRET_KEY in .env for production!")
     SECRET_KEY = secrets.token_urlsafe(32)
 ALGORITHM = "HS256"
+# Encoded once so signing/verification doesn't re-encode the key per call
+_SECRET = SECRET_KEY.encode("utf-8")
+# Decoded tokens kept in memory; a chatty client re-sends the same token
+TOKEN_CACHE_SIZE = 4096
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
 # HTTP Bearer token security scheme
@@ -102,31 +109,44 @@ def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta]
         Encoded JWT token
     """
     to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    lifetime = expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    now = int(time.time())
     
-    to_encode.update({"exp": expire, "iat": datetime.utcnow()})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    to_encode.update({"exp": now + int(lifetime.total_seconds()), "iat": now})
+    encoded_jwt = jwt.encode(to_encode, _SECRET, algorithm=ALGORITHM)
     return encoded_jwt
 
+@lru_cache(maxsize=TOKEN_CACHE_SIZE)
+def _decode_token(token: str) -> Optional[Dict[str, Any]]:
+    """Signature-check and decode a token once; repeat calls hit the cache."""
+    try:
+        return jwt.decode(token, _SECRET, algorithms=[ALGORITHM])
+    except jwt.PyJWTError as e:
+        logger.warning(f"JWT verification failed: {e}")
+        return None
+
 def verify_token(token: str) -> Optional[Dict[str, Any]]:
     """
     Verify and decode a JWT token.
     
+    Decoded payloads are cached per token string, so expiry is re-checked
+    against the cached ``exp`` claim on every call.
+    
     Args:
         token: JWT token string
         
     Returns:
         Decoded token payload or None if invalid
     """
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
-    except JWTError as e:
-        logger.warning(f"JWT verification failed: {e}")
+    payload = _decode_token(token)
+    if payload is None:
+        return None
+    
+    exp = payload.get("exp")
+    if exp is not None and exp <= time.time():
+        logger.warning("JWT verification failed: Signature has expired")
         return None
+    return payload
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security)
@@ -196,7 +216,8 @@ async def verify_api_key(
             detail="Missing API key"
         )
     
-    if x_api_key != INTERNAL_API_KEY:
+    # Constant-time comparison so the key can't be recovered via response timing
+    if not secrets.compare_digest(x_api_key.encode("utf-8"), _INTERNAL_API_KEY_BYTES):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid API key"
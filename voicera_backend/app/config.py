@@ -2,6 +2,7 @@
 Configuration management for the application.
 """
 import os
+from dataclasses import dataclass, field
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -9,6 +10,7 @@ from dotenv import load_dotenv
 env_path = Path(__file__).parent.parent / ".env"
 load_dotenv(dotenv_path=env_path)
 
+@dataclass(frozen=True, slots=True)
 class Settings:
     """Application settings loaded from environment variables."""
     
@@ -19,6 +21,9 @@ class Settings:
     MONGODB_PASSWORD: str = os.getenv("MONGODB_PASSWORD", "admin123")
     MONGODB_DATABASE: str = os.getenv("MONGODB_DATABASE", "voicera")
     MONGODB_AUTH_SOURCE: str = os.getenv("MONGODB_AUTH_SOURCE", "admin")
+    MONGODB_MAX_POOL_SIZE: int = int(os.getenv("MONGODB_MAX_POOL_SIZE", "100"))
+    MONGODB_MIN_POOL_SIZE: int = int(os.getenv("MONGODB_MIN_POOL_SIZE", "10"))
+    MONGODB_COMPRESSORS: str = os.getenv("MONGODB_COMPRESSORS", "zstd,zlib")
     
     # Application Configuration
     API_V1_PREFIX: str = "/api/v1"
@@ -33,6 +38,11 @@ class Settings:
     MAILTRAP_FROM_NAME: str = os.getenv("MAILTRAP_FROM_NAME", "Voicera")
     FRONTEND_URL: str = os.getenv("FRONTEND_URL", "http://localhost:3000")  # For reset password link
     
+    # CORS: comma-separated allowed origins ("*" allows any; pin in production)
+    CORS_ORIGINS: tuple = tuple(
+        origin.strip() for origin in os.getenv("CORS_ORIGINS", "*").split(",") if origin.strip()
+    )
+    
     # Internal API Key for service-to-service communication (bot -> backend)
     INTERNAL_API_KEY: str = os.getenv("INTERNAL_API_KEY", "")
     
@@ -42,14 +52,16 @@ class Settings:
     VOBIZ_AUTH_ID: str = os.getenv("VOBIZ_AUTH_ID", "")
     VOBIZ_AUTH_TOKEN: str = os.getenv("VOBIZ_AUTH_TOKEN", "")
     
-    @property
-    def mongodb_uri(self) -> str:
+    # Derived once in __post_init__ rather than rebuilt on every access
+    mongodb_uri: str = field(init=False)
+    
+    def __post_init__(self) -> None:
         """Build MongoDB connection URI."""
-        return (
+        object.__setattr__(self, "mongodb_uri", (
             f"mongodb://{self.MONGODB_USER}:{self.MONGODB_PASSWORD}"
             f"@{self.MONGODB_HOST}:{self.MONGODB_PORT}/{self.MONGODB_DATABASE}"
             f"?authSource={self.MONGODB_AUTH_SOURCE}"
-        )
+        ))
 
 # Global settings instance
 settings = Settings()
@@ -20,8 +20,16 @@ mongodb = MongoDB()
 def connect_to_mongo():
     """Create database connection."""
     try:
+        # One pooled client for the process lifetime; keep a warm floor of
+        # connections so request bursts don't pay TCP + auth setup
         mongodb.client = MongoClient(
             settings.mongodb_uri,
+            maxPoolSize=settings.MONGODB_MAX_POOL_SIZE,
+            minPoolSize=settings.MONGODB_MIN_POOL_SIZE,
+            maxIdleTimeMS=60000,
+            waitQueueTimeoutMS=2000,
+            compressors=settings.MONGODB_COMPRESSORS,
+            retryWrites=True,
             serverSelectionTimeoutMS=5000
         )
         # Test the connection
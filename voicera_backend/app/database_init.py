@@ -1,12 +1,96 @@
 """
 Database initialization - creates collections and indexes on startup.
 """
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pymongo import ASCENDING, IndexModel
+from pymongo.errors import OperationFailure
 from app.database import get_database
 from app.config import settings
 import logging
 
 logger = logging.getLogger(__name__)
 
+def _index(keys, **options):
+    """IndexModel built in the background so existing data isn't locked while it builds."""
+    # Implicit on MongoDB 4.2+, explicit here for older servers
+    return IndexModel(keys, background=True, **options)
+
+# Index specs per collection. createIndexes is idempotent for identical specs
+# and implicitly creates missing collections, so every startup sends exactly
+# one command per collection regardless of what already exists.
+COLLECTION_INDEXES = {
+    "UserTable": [
+        _index([("email", ASCENDING)], unique=True, name="email_unique"),
+    ],
+    "AgentConfig": [
+        # Compound unique indexes: same agent_type/agent_id can exist in different orgs
+        _index([("agent_type", ASCENDING), ("org_id", ASCENDING)], unique=True, name="agent_type_org_unique"),
+        _index([("agent_id", ASCENDING), ("org_id", ASCENDING)], unique=True, name="agent_id_org_unique"),
+        _index([("org_id", ASCENDING)], name="org_id_index"),
+        # Inbound-call lookup (fetch_agent_by_phone_number); most agents have no number
+        _index([("phone_number", ASCENDING)], sparse=True, name="agent_phone_lookup"),
+    ],
+    "Audience": [
+        _index([("audience_name", ASCENDING)], unique=True, name="audience_name_unique"),
+        _index([("phone_number", ASCENDING)], name="phone_number_index"),
+    ],
+    "Campaigns": [
+        _index([("campaign_name", ASCENDING)], unique=True, name="campaign_name_unique"),
+    ],
+    "CallLogs": [
+        _index([("meeting_id", ASCENDING)], unique=True, name="meeting_id_unique"),
+    ],
+    "PhoneNumber": [
+        _index([("phone_number", ASCENDING)], unique=True, name="phone_number_unique"),
+        _index([("provider", ASCENDING)], name="provider_index"),
+        _index([("org_id", ASCENDING)], name="org_id_index"),
+        _index([("agent_type", ASCENDING)], name="agent_type_index"),
+        _index([("org_id", ASCENDING), ("agent_type", ASCENDING)], name="org_agent_compound"),
+    ],
+    "Members": [
+        # Compound unique index: same email can exist in multiple orgs, but not twice in same org
+        _index([("email", ASCENDING), ("org_id", ASCENDING)], unique=True, name="email_org_unique"),
+        _index([("org_id", ASCENDING)], name="org_id_index"),
+        _index([("email", ASCENDING)], name="email_index"),
+    ],
+    "Integrations": [
+        # Compound unique index: same org_id + model combination must be unique
+        _index([("org_id", ASCENDING), ("model", ASCENDING)], unique=True, name="org_model_unique"),
+        _index([("org_id", ASCENDING)], name="org_id_index"),
+    ],
+}
+
+# Global unique indexes replaced by the per-org compound ones above
+LEGACY_AGENT_CONFIG_INDEXES = ("agent_type_unique", "agent_id_unique")
+# IndexAlreadyExists, IndexOptionsConflict, IndexKeySpecsConflict
+INDEX_EXISTS_CODES = frozenset({68, 85, 86})
+INDEX_NOT_FOUND_CODE = 27
+
+# SchemaMigrations marker recording that the legacy indexes were dropped
+AGENT_CONFIG_MIGRATION_ID = "agentconfig_v2"
+
+def _ensure_indexes(db, name, models):
+    """Create one collection's indexes; returns (name, ok, error)."""
+    collection = db[name]
+    try:
+        collection.create_indexes(models)
+        return name, True, None
+    except OperationFailure as e:
+        if e.code not in INDEX_EXISTS_CODES:
+            return name, False, e
+    
+    # One spec matches an existing index under another name/options, which
+    # fails the whole batch; retry one by one so the rest still get built
+    for model in models:
+        try:
+            collection.create_indexes([model])
+        except OperationFailure as e:
+            if e.code not in INDEX_EXISTS_CODES:
+                return name, False, e
+            logger.debug(f"Index already present on {name}: {e}")
+    return name, True, None
+
 def initialize_database():
     """
     Initialize database collections and indexes.
@@ -14,167 +98,44 @@ def initialize_database():
     """
     try:
         db = get_database()
-        existing_collections = db.list_collection_names()
-        
-        # 1. UserTable collection
-        if "UserTable" not in existing_collections:
-            logger.info("Creating UserTable collection...")
-            user_table = db["UserTable"]
-            user_table.create_index("email", unique=True, name="email_unique")
-            logger.info("✓ Created UserTable with unique index on 'email'")
-        else:
-            logger.debug("UserTable collection already exists. Ensuring indexes...")
-            user_table = db["UserTable"]
-            try:
-                user_table.create_index("email", unique=True, name="email_unique")
-            except Exception as e:
-                if "already exists" not in str(e).lower() and "duplicate" not in str(e).lower():
-                    logger.warning(f"Index creation warning: {e}")
-        
-        # 2. AgentConfig collection
-        if "AgentConfig" not in existing_collections:
-            logger.info("Creating AgentConfig collection...")
-            agent_config = db["AgentConfig"]
-            # Compound unique indexes: same agent_type/agent_id can exist in different orgs
-            agent_config.create_index([("agent_type", 1), ("org_id", 1)], unique=True, name="agent_type_org_unique")
-            agent_config.create_index([("agent_id", 1), ("org_id", 1)], unique=True, name="agent_id_org_unique")
-            agent_config.create_index("org_id", name="org_id_index")
-            logger.info("✓ Created AgentConfig with compound unique indexes on 'agent_type+org_id' and 'agent_id+org_id'")
-        else:
-            logger.debug("AgentConfig collection already exists. Ensuring indexes...")
+
+        # Drop old global unique indexes on AgentConfig if they exist. A marker
+        # document records that this ran, so warm restarts skip it entirely.
+        migrations = db["SchemaMigrations"]
+        if not migrations.find_one({"_id": AGENT_CONFIG_MIGRATION_ID}, {"_id": 1}):
             agent_config = db["AgentConfig"]
-            try:
-                # Drop old global unique indexes if they exist
-                try:
-                    agent_config.drop_index("agent_type_unique")
-                    logger.info("Dropped old agent_type_unique index")
-                except Exception:
-                    pass  # Index doesn't exist
-                try:
-                    agent_config.drop_index("agent_id_unique")
-                    logger.info("Dropped old agent_id_unique index")
-                except Exception:
-                    pass  # Index doesn't exist
-                
-                # Create new compound unique indexes
-                agent_config.create_index([("agent_type", 1), ("org_id", 1)], unique=True, name="agent_type_org_unique")
-                agent_config.create_index([("agent_id", 1), ("org_id", 1)], unique=True, name="agent_id_org_unique")
-                agent_config.create_index("org_id", name="org_id_index")
-            except Exception as e:
-                if "already exists" not in str(e).lower() and "duplicate" not in str(e).lower():
-                    logger.warning(f"Index creation warning: {e}")
-        
-        # 3. Audience collection
-        if "Audience" not in existing_collections:
-            logger.info("Creating Audience collection...")
-            audience = db["Audience"]
-            audience.create_index("audience_name", unique=True, name="audience_name_unique")
-            audience.create_index("phone_number", name="phone_number_index")
-            logger.info("✓ Created Audience with unique index on 'audience_name'")
-        else:
-            logger.debug("Audience collection already exists. Ensuring indexes...")
-            audience = db["Audience"]
-            try:
-                audience.create_index("audience_name", unique=True, name="audience_name_unique")
-                audience.create_index("phone_number", name="phone_number_index")
-            except Exception as e:
-                if "already exists" not in str(e).lower() and "duplicate" not in str(e).lower():
-                    logger.warning(f"Index creation warning: {e}")
-        
-        # 4. Campaigns collection
-        if "Campaigns" not in existing_collections:
-            logger.info("Creating Campaigns collection...")
-            campaigns = db["Campaigns"]
-            campaigns.create_index("campaign_name", unique=True, name="campaign_name_unique")
-            logger.info("✓ Created Campaigns with unique index on 'campaign_name'")
-        else:
-            logger.debug("Campaigns collection already exists. Ensuring indexes...")
-            campaigns = db["Campaigns"]
-            try:
-                campaigns.create_index("campaign_name", unique=True, name="campaign_name_unique")
-            except Exception as e:
-                if "already exists" not in str(e).lower() and "duplicate" not in str(e).lower():
-                    logger.warning(f"Index creation warning: {e}")
-        
-        # 5. CallLogs collection
-        if "CallLogs" not in existing_collections:
-            logger.info("Creating CallLogs collection...")
-            call_logs = db["CallLogs"]
-            call_logs.create_index("meeting_id", unique=True, name="meeting_id_unique")
-            logger.info("✓ Created CallLogs with unique index on 'meeting_id'")
-        else:
-            logger.debug("CallLogs collection already exists. Ensuring indexes...")
-            call_logs = db["CallLogs"]
-            try:
-                call_logs.create_index("meeting_id", unique=True, name="meeting_id_unique")
-            except Exception as e:
-                if "already exists" not in str(e).lower() and "duplicate" not in str(e).lower():
-                    logger.warning(f"Index creation warning: {e}")
-        
-        # 6. PhoneNumber collection
-        if "PhoneNumber" not in existing_collections:
-            logger.info("Creating PhoneNumber collection...")
-            phone_number = db["PhoneNumber"]
-            phone_number.create_index("phone_number", unique=True, name="phone_number_unique")
-            phone_number.create_index("provider", name="provider_index")
-            phone_number.create_index("org_id", name="org_id_index")
-            phone_number.create_index("agent_type", name="agent_type_index")
-            phone_number.create_index([("org_id", 1), ("agent_type", 1)], name="org_agent_compound")
-            logger.info("✓ Created PhoneNumber with indexes")
-        else:
-            logger.debug("PhoneNumber collection already exists. Ensuring indexes...")
-            phone_number = db["PhoneNumber"]
-            try:
-                phone_number.create_index("phone_number", unique=True, name="phone_number_unique")
-                phone_number.create_index("provider", name="provider_index")
-                phone_number.create_index("org_id", name="org_id_index")
-                phone_number.create_index("agent_type", name="agent_type_index")
-                phone_number.create_index([("org_id", 1), ("agent_type", 1)], name="org_agent_compound")
-            except Exception as e:
-                if "already exists" not in str(e).lower() and "duplicate" not in str(e).lower():
-                    logger.warning(f"Index creation warning: {e}")
-        
-        # 7. Members collection
-        if "Members" not in existing_collections:
-            logger.info("Creating Members collection...")
-            members = db["Members"]
-            # Compound unique index: same email can exist in multiple orgs, but not twice in same org
-            members.create_index([("email", 1), ("org_id", 1)], unique=True, name="email_org_unique")
-            members.create_index("org_id", name="org_id_index")
-            members.create_index("email", name="email_index")
-            logger.info("✓ Created Members with compound unique index on 'email' + 'org_id'")
-        else:
-            logger.debug("Members collection already exists. Ensuring indexes...")
-            members = db["Members"]
-            try:
-                members.create_index([("email", 1), ("org_id", 1)], unique=True, name="email_org_unique")
-                members.create_index("org_id", name="org_id_index")
-                members.create_index("email", name="email_index")
-            except Exception as e:
-                if "already exists" not in str(e).lower() and "duplicate" not in str(e).lower():
-                    logger.warning(f"Index creation warning: {e}")
-        
-        # 8. Integrations collection
-        if "Integrations" not in existing_collections:
-            logger.info("Creating Integrations collection...")
-            integrations = db["Integrations"]
-            # Compound unique index: same org_id + model combination must be unique
-            integrations.create_index([("org_id", 1), ("model", 1)], unique=True, name="org_model_unique")
-            integrations.create_index("org_id", name="org_id_index")
-            logger.info("✓ Created Integrations with compound unique index on 'org_id' + 'model'")
-        else:
-            logger.debug("Integrations collection already exists. Ensuring indexes...")
-            integrations = db["Integrations"]
-            try:
-                integrations.create_index([("org_id", 1), ("model", 1)], unique=True, name="org_model_unique")
-                integrations.create_index("org_id", name="org_id_index")
-            except Exception as e:
-                if "already exists" not in str(e).lower() and "duplicate" not in str(e).lower():
-                    logger.warning(f"Index creation warning: {e}")
-        
+            existing_indexes = agent_config.index_information()
+            for old_index in LEGACY_AGENT_CONFIG_INDEXES:
+                if old_index in existing_indexes:
+                    try:
+                        agent_config.drop_index(old_index)
+                        logger.info(f"Dropped old {old_index} index")
+                    except OperationFailure as e:
+                        # Another process starting alongside us dropped it first
+                        if e.code != INDEX_NOT_FOUND_CODE:
+                            raise
+                        logger.debug(f"Old {old_index} index already dropped: {e}")
+            # Upsert so concurrently starting workers don't race on insert
+            migrations.update_one(
+                {"_id": AGENT_CONFIG_MIGRATION_ID},
+                {"$setOnInsert": {"applied_at": datetime.now().isoformat()}},
+                upsert=True
+            )
+            logger.info(f"Applied migration {AGENT_CONFIG_MIGRATION_ID}")
+
+        # Collections are independent and PyMongo releases the GIL on socket
+        # I/O, so fan out: each worker checks out its own pooled connection
+        with ThreadPoolExecutor(max_workers=len(COLLECTION_INDEXES)) as executor:
+            results = list(executor.map(
+                lambda item: _ensure_indexes(db, *item), COLLECTION_INDEXES.items()
+            ))
+        for name, ok, error in results:
+            if not ok:
+                logger.warning(f"Index creation warning for {name}: {error}")
+
         logger.info("Database initialization completed successfully")
-        logger.info("Collections verified: UserTable, AgentConfig, Audience, Campaigns, CallLogs, PhoneNumber, Members, Integrations")
-        
+        logger.info(f"Collections verified: {', '.join(COLLECTION_INDEXES)}")
+
     except Exception as e:
         logger.error(f"Error initializing database: {e}")
-        raise
\ No newline at end of file
+        raise
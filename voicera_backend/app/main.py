@@ -1,8 +1,10 @@
 """
 Main FastAPI application.
 """
+import asyncio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from app.config import settings
 from app.database import connect_to_mongo, close_mongo_connection
 from app.routers import users, agents, meetings, campaigns, audience, call_recordings, phone_numbers, vobiz, analytics, integrations, members
@@ -21,20 +23,25 @@ app = FastAPI(
     version=settings.VERSION,
     description="Voicera Backend API - MongoDB-based backend service",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
+    allow_origins=settings.CORS_ORIGINS,  # Set CORS_ORIGINS in production
     allow_credentials=True,
     allow_methods=["*"],
-    allow_headers=["*"],
+    # Fixed header list lets Starlette answer preflights from a prebuilt header set
+    allow_headers=["authorization", "content-type", "accept", "x-api-key"],
+    # Let browsers reuse a preflight for a day instead of re-sending OPTIONS
+    max_age=86400,
 )
 
 # Include routers
 app.include_router(users.router, prefix=settings.API_V1_PREFIX)
+app.include_router(agents.bot_router, prefix=settings.API_V1_PREFIX)
 app.include_router(agents.router, prefix=settings.API_V1_PREFIX)
 app.include_router(meetings.router, prefix=settings.API_V1_PREFIX)
 app.include_router(campaigns.router, prefix=settings.API_V1_PREFIX)
@@ -51,10 +58,12 @@ async def startup_event():
     """Initialize database connection and setup on startup."""
     logger.info("Starting up application...")
     try:
-        connect_to_mongo()
-        # Initialize database collections and indexes
+        # Blocking connect + ping runs in a worker thread, not on the event loop
+        await asyncio.to_thread(connect_to_mongo)
+        # Initialize database collections and indexes before serving, so
+        # unique constraints exist for the first request
         from app.database_init import initialize_database
-        initialize_database()
+        await asyncio.to_thread(initialize_database)
         logger.info("Application started successfully")
     except Exception as e:
         logger.error(f"Failed to start application: {e}")
@@ -82,7 +91,7 @@ async def health_check():
     try:
         from app.database import mongodb
         if mongodb.client:
-            mongodb.client.admin.command('ping')
+            await asyncio.to_thread(mongodb.client.admin.command, 'ping')
             return {"status": "healthy", "database": "connected"}
         return {"status": "unhealthy", "database": "disconnected"}
     except Exception as e:
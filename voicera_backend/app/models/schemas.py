@@ -1,7 +1,7 @@
 """
 Pydantic models for request/response validation.
 """
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 
@@ -86,6 +86,8 @@ class AgentConfigUpdate(BaseModel):
 
 # Meeting Models
 class MeetingCreate(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)  # Allow both "from"/"from_number" and "to"/"to_number"
+    
     meeting_id: str
     agent_type: str
     org_id: Optional[str] = None  # Make sure this field exists!
@@ -96,9 +98,6 @@ class MeetingCreate(BaseModel):
     to_number: Optional[str] = None
     created_at: Optional[str] = None
     call_busy: Optional[bool] = None
-    
-    class Config:
-        populate_by_name = True  # Allow both "from"/"from_number" and "to"/"to_number"
 
 class MeetingResponse(BaseModel):
     """Schema for meeting response."""
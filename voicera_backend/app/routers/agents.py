@@ -1,6 +1,9 @@
 """
 Agent API routes.
 """
+import asyncio
+import re
+from urllib.parse import unquote
 from fastapi import APIRouter, HTTPException, status, Depends
 from app.models.schemas import (
     AgentConfigCreate, AgentConfigResponse, AgentConfigUpdate,
@@ -11,23 +14,31 @@ from app.auth import get_current_user, verify_api_key
 from typing import Dict, Any, List
 
 router = APIRouter(prefix="/agents", tags=["agents"])
+# Bot endpoints share one router-level API key check instead of a per-route parameter
+bot_router = APIRouter(prefix="/agents", tags=["agents-bot"], dependencies=[Depends(verify_api_key)])
+
+# E.164, as sent by the bot (format: +918071387434)
+_PHONE_RE = re.compile(r"^\+\d{7,15}$")
+
+# agent_service scoped-write error codes -> HTTP status
+_SCOPED_WRITE_ERRORS = {
+    "not_found": status.HTTP_404_NOT_FOUND,
+    "forbidden": status.HTTP_403_FORBIDDEN,
+}
 
 
 # ============================================================================
 # Bot Endpoints (API Key Authentication)
 # ============================================================================
 
-@router.get("/config/{agent_type}", response_model=AgentConfigResponse)
-async def get_agent_config_for_bot(
-    agent_type: str,
-    _: bool = Depends(verify_api_key)
-):
+@bot_router.get("/config/{agent_type}", response_model=AgentConfigResponse)
+async def get_agent_config_for_bot(agent_type: str):
     """
     Get agent configuration by agent_type (bot endpoint).
     
     Requires X-API-Key header for authentication.
     """
-    agent = agent_service.fetch_agent_config(agent_type)
+    agent = await asyncio.to_thread(agent_service.fetch_agent_config, agent_type)
     if not agent:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -36,17 +47,14 @@ async def get_agent_config_for_bot(
     return agent
 
 
-@router.get("/config/id/{agent_id}", response_model=AgentConfigResponse)
-async def get_agent_config_by_id_for_bot(
-    agent_id: str,
-    _: bool = Depends(verify_api_key)
-):
+@bot_router.get("/config/id/{agent_id}", response_model=AgentConfigResponse)
+async def get_agent_config_by_id_for_bot(agent_id: str):
     """
     Get agent configuration by agent_id (bot endpoint).
     
     Requires X-API-Key header for authentication.
     """
-    agent = agent_service.fetch_agent_config_by_id(agent_id)
+    agent = await asyncio.to_thread(agent_service.fetch_agent_config_by_id, agent_id)
     if not agent:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -55,11 +63,8 @@ async def get_agent_config_by_id_for_bot(
     return agent
 
 
-@router.get("/by-phone/{phone_number}", response_model=AgentConfigResponse)
-async def get_agent_by_phone_number(
-    phone_number: str,
-    _: bool = Depends(verify_api_key)
-):
+@bot_router.get("/by-phone/{phone_number}", response_model=AgentConfigResponse)
+async def get_agent_by_phone_number(phone_number: str):
     """
     Get agent configuration by phone number (bot endpoint).
     
@@ -67,11 +72,16 @@ async def get_agent_by_phone_number(
     Phone number format: +918071387434
     """
     # URL decode the phone number (+ becomes %2B in URLs)
-    from urllib.parse import unquote
     decoded_phone = unquote(phone_number)
+    # Reject malformed numbers before spending a database round-trip on them
+    if not _PHONE_RE.match(decoded_phone):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid phone number format, expected E.164 (e.g. +918071387434)"
+        )
     
     # Use phone number as-is (format: +918071387434)
-    agent = agent_service.fetch_agent_by_phone_number(decoded_phone)
+    agent = await asyncio.to_thread(agent_service.fetch_agent_by_phone_number, decoded_phone)
     if not agent:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -98,7 +108,7 @@ async def create_agent(
             detail="Not authorized to create agents for this organization"
         )
     
-    result = agent_service.create_agent(agent_data)
+    result = await asyncio.to_thread(agent_service.create_agent, agent_data)
     if result["status"] == "fail":
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -121,7 +131,7 @@ async def get_agents_by_org(
             detail="Not authorized to access this organization's agents"
         )
     
-    agents = agent_service.fetch_agents_of_org(org_id)
+    agents = await asyncio.to_thread(agent_service.fetch_agents_of_org, org_id)
     return agents
 
 
@@ -133,7 +143,7 @@ async def get_agent_config(
     """
     Get agent configuration by agent_type (protected endpoint).
     """
-    agent = agent_service.fetch_agent_config(agent_type)
+    agent = await asyncio.to_thread(agent_service.fetch_agent_config, agent_type)
     if not agent:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -158,23 +168,11 @@ async def update_agent_config(
     """
     Update agent configuration (protected endpoint).
     """
-    agent = agent_service.fetch_agent_config(agent_type)
-    if not agent:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Agent type not found"
-        )
-    
-    if agent.get("org_id") != current_user["org_id"]:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to update this agent"
-        )
-    
-    result = agent_service.update_agent_config(agent_type, agent_data)
+    # Single org-scoped write; the service tells 404 from 403 only on a miss
+    result = await asyncio.to_thread(agent_service.update_agent_config, agent_type, agent_data, current_user["org_id"])
     if result["status"] == "fail":
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
+            status_code=_SCOPED_WRITE_ERRORS.get(result.get("error"), status.HTTP_400_BAD_REQUEST),
             detail=result["message"]
         )
     return result
@@ -188,23 +186,11 @@ async def delete_agent(
     """
     Delete an agent configuration (protected endpoint).
     """
-    agent = agent_service.fetch_agent_config(agent_type)
-    if not agent:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Agent type not found"
-        )
-    
-    if agent.get("org_id") != current_user["org_id"]:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to delete this agent"
-        )
-    
-    result = agent_service.delete_agent(agent_type)
+    # Single org-scoped write; the service tells 404 from 403 only on a miss
+    result = await asyncio.to_thread(agent_service.delete_agent, agent_type, current_user["org_id"])
     if result["status"] == "fail":
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
+            status_code=_SCOPED_WRITE_ERRORS.get(result.get("error"), status.HTTP_400_BAD_REQUEST),
             detail=result["message"]
         )
     return result
\ No newline at end of file
@@ -1,6 +1,7 @@
 """
 Analytics API routes.
 """
+import asyncio
 from fastapi import APIRouter, HTTPException, status, Depends, Query
 from app.models.schemas import AnalyticsResponse
 from app.services import analytics_service
@@ -49,7 +50,8 @@ async def get_analytics(
         
         # If date range is provided, use date range function
         if start_date or end_date:
-            analytics = analytics_service.get_analytics_by_date_range(
+            analytics = await asyncio.to_thread(
+                analytics_service.get_analytics_by_date_range,
                 org_id=org_id,
                 start_date=start_date,
                 end_date=end_date,
@@ -57,7 +59,8 @@ async def get_analytics(
             )
         else:
             # Otherwise use standard analytics function
-            analytics = analytics_service.get_analytics(
+            analytics = await asyncio.to_thread(
+                analytics_service.get_analytics,
                 org_id=org_id,
                 agent_type=agent_type,
                 phone_number=phone_number
@@ -1,6 +1,7 @@
 """
 Audience API routes.
 """
+import asyncio
 from fastapi import APIRouter, HTTPException, status, Query, Depends
 from app.models.schemas import AudienceCreate, AudienceResponse
 from app.services import audience_service
@@ -17,7 +18,7 @@ async def create_audience(
     """
     Create a new audience entry (protected endpoint).
     """
-    result = audience_service.create_audience(audience_data)
+    result = await asyncio.to_thread(audience_service.create_audience, audience_data)
     if result["status"] == "fail":
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -33,7 +34,7 @@ async def get_audience(
     """
     Get audience by name (protected endpoint).
     """
-    audience = audience_service.get_audience_by_name(audience_name)
+    audience = await asyncio.to_thread(audience_service.get_audience_by_name, audience_name)
     if not audience:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -49,6 +50,6 @@ async def get_all_audiences(
     """
     Get all audiences, optionally filtered by phone number (protected endpoint).
     """
-    audiences = audience_service.get_all_audiences(phone_number)
+    audiences = await asyncio.to_thread(audience_service.get_all_audiences, phone_number)
     return audiences
 
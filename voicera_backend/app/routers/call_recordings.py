@@ -1,6 +1,7 @@
 """
 Call recording API routes.
 """
+import asyncio
 from fastapi import APIRouter, HTTPException, status
 from app.models.schemas import CallRecordingCreate
 from app.services import call_recording_service
@@ -25,7 +26,7 @@ async def save_call_recording(recording_data: CallRecordingCreate):
     Returns:
         Updated meeting document
     """
-    result = call_recording_service.save_call_recording(recording_data)
+    result = await asyncio.to_thread(call_recording_service.save_call_recording, recording_data)
     
     if isinstance(result, dict) and result.get("status") == "fail":
         raise HTTPException(
@@ -1,6 +1,7 @@
 """
 Campaign API routes.
 """
+import asyncio
 from fastapi import APIRouter, HTTPException, status, Depends
 from app.models.schemas import CampaignCreate, CampaignResponse
 from app.services import campaign_service
@@ -28,7 +29,7 @@ async def create_campaign(
             detail="Not authorized to create campaigns for this organization"
         )
     
-    result = campaign_service.create_campaign(campaign_data)
+    result = await asyncio.to_thread(campaign_service.create_campaign, campaign_data)
     if result["status"] == "fail":
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -51,7 +52,7 @@ async def get_campaigns_by_org(
             detail="Not authorized to access this organization's campaigns"
         )
     
-    campaigns = campaign_service.get_all_campaigns(org_id)
+    campaigns = await asyncio.to_thread(campaign_service.get_all_campaigns, org_id)
     return campaigns
 
 @router.get("/{campaign_name}", response_model=CampaignResponse)
@@ -62,7 +63,7 @@ async def get_campaign(
     """
     Get campaign by name (protected endpoint).
     """
-    campaign = campaign_service.get_campaign_by_name(campaign_name)
+    campaign = await asyncio.to_thread(campaign_service.get_campaign_by_name, campaign_name)
     if not campaign:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1,6 +1,7 @@
 """
 Integration API routes.
 """
+import asyncio
 from fastapi import APIRouter, HTTPException, status, Depends
 from app.models.schemas import (
     IntegrationCreate, IntegrationResponse, IntegrationBotRequest,
@@ -28,7 +29,7 @@ async def get_integration_for_bot(
     Requires X-API-Key header for authentication.
     Used by bot.py to retrieve API keys for LLM providers.
     """
-    integration = integration_service.get_integration(request.org_id, request.model)
+    integration = await asyncio.to_thread(integration_service.get_integration, request.org_id, request.model)
     if not integration:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -58,7 +59,7 @@ async def create_integration(
             detail="Not authorized to create integrations for this organization"
         )
     
-    result = integration_service.create_integration(integration_data)
+    result = await asyncio.to_thread(integration_service.create_integration, integration_data)
     if result["status"] == "fail":
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -78,7 +79,7 @@ async def get_integration(
     Returns the decrypted API key.
     """
     org_id = current_user["org_id"]
-    integration = integration_service.get_integration(org_id, model)
+    integration = await asyncio.to_thread(integration_service.get_integration, org_id, model)
     
     if not integration:
         raise HTTPException(
@@ -99,7 +100,7 @@ async def get_all_integrations(
     Returns all integrations with decrypted API keys.
     """
     org_id = current_user["org_id"]
-    integrations = integration_service.get_integrations_by_org(org_id)
+    integrations = await asyncio.to_thread(integration_service.get_integrations_by_org, org_id)
     return integrations
 
 
@@ -114,14 +115,14 @@ async def delete_integration(
     org_id = current_user["org_id"]
     
     # Check if integration exists
-    integration = integration_service.get_integration(org_id, model)
+    integration = await asyncio.to_thread(integration_service.get_integration, org_id, model)
     if not integration:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Integration not found for model: {model}"
         )
     
-    result = integration_service.delete_integration(org_id, model)
+    result = await asyncio.to_thread(integration_service.delete_integration, org_id, model)
     if result["status"] == "fail":
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -1,6 +1,7 @@
 """
 Meeting API routes.
 """
+import asyncio
 from fastapi import APIRouter, HTTPException, status, Depends, Query, Response
 from fastapi.responses import StreamingResponse
 from app.models.schemas import MeetingCreate, MeetingResponse, MeetingUpdate
@@ -31,7 +32,7 @@ async def create_meeting(
     This endpoint is called by the voice bot when a call begins.
     Requires X-API-Key header for authentication.
     """
-    result = meeting_service.setup_meeting_id(meeting_data)
+    result = await asyncio.to_thread(meeting_service.setup_meeting_id, meeting_data)
     if isinstance(result, dict) and result.get("status") == "fail":
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -53,7 +54,7 @@ async def update_meeting(
     This endpoint is called by the voice bot when a call ends.
     Requires X-API-Key header for authentication.
     """
-    result = meeting_service.update_meeting_end_time(meeting_id, update_data.end_time_utc)
+    result = await asyncio.to_thread(meeting_service.update_meeting_end_time, meeting_id, update_data.end_time_utc)
     if isinstance(result, dict) and result.get("status") == "fail":
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -85,9 +86,9 @@ async def get_meetings(
     org_id = current_user["org_id"]
     
     if agent_type:
-        meetings = meeting_service.fetch_meetings_by_org_and_agent(org_id, agent_type)
+        meetings = await asyncio.to_thread(meeting_service.fetch_meetings_by_org_and_agent, org_id, agent_type)
     else:
-        meetings = meeting_service.fetch_meetings_of_org(org_id)
+        meetings = await asyncio.to_thread(meeting_service.fetch_meetings_of_org, org_id)
     
     return meetings
 
@@ -102,7 +103,7 @@ async def get_meeting(
     
     Only returns the meeting if it belongs to the user's organization.
     """
-    meeting = meeting_service.fetch_meeting_details(meeting_id)
+    meeting = await asyncio.to_thread(meeting_service.fetch_meeting_details, meeting_id)
     if not meeting:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -150,7 +151,7 @@ async def get_meeting_recording(
     In Swagger UI, click "Try it out" → "Execute", then click the response URL to play/download the audio.
     """
     # Verify meeting exists and belongs to user's org
-    meeting = meeting_service.fetch_meeting_details(meeting_id)
+    meeting = await asyncio.to_thread(meeting_service.fetch_meeting_details, meeting_id)
     if not meeting:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -191,7 +192,7 @@ async def get_meeting_recording(
     bucket_name, object_name = parsed
     
     # Check if object exists
-    if not storage.object_exists(bucket_name, object_name):
+    if not await asyncio.to_thread(storage.object_exists, bucket_name, object_name):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Recording file not found: {object_name}"
@@ -1,6 +1,7 @@
 """
 Member API routes.
 """
+import asyncio
 from fastapi import APIRouter, HTTPException, status, Depends
 from app.models.schemas import (
     MemberCreate, MemberResponse, MemberDelete,
@@ -20,7 +21,7 @@ async def add_member(member_data: MemberCreate):
     This is used for invite links where new users don't have authentication yet.
     The org_id in the request body determines which organization the member joins.
     """
-    result = member_service.add_member(member_data)
+    result = await asyncio.to_thread(member_service.add_member, member_data)
     if result["status"] == "fail":
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -44,7 +45,7 @@ async def get_members(
             detail="Not authorized to access members of this organization"
         )
     
-    result = member_service.get_members_by_org(org_id)
+    result = await asyncio.to_thread(member_service.get_members_by_org, org_id)
     if result["status"] == "fail":
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -68,7 +69,7 @@ async def delete_member(
             detail="Not authorized to delete members from this organization"
         )
     
-    result = member_service.delete_member(member_data)
+    result = await asyncio.to_thread(member_service.delete_member, member_data)
     if result["status"] == "fail":
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -1,6 +1,7 @@
 """
 Phone number API routes.
 """
+import asyncio
 from fastapi import APIRouter, HTTPException, status, Depends
 from app.models.schemas import (
     PhoneNumberAttachRequest, PhoneNumberDetachRequest, PhoneNumberResponse
@@ -26,7 +27,7 @@ async def get_all_phone_numbers_by_org(
             detail="Not authorized to access this organization's phone numbers"
         )
     
-    phone_numbers = phone_number.get_all_phone_numbers_by_org(org_id)
+    phone_numbers = await asyncio.to_thread(phone_number.get_all_phone_numbers_by_org, org_id)
     return phone_numbers
 
 
@@ -39,7 +40,7 @@ async def get_phone_number_by_agent_type(
     Get the phone number attached to an agent by agent_type (protected endpoint).
     """
     # Validate that the agent belongs to the user's organization
-    agent = agent_service.fetch_agent_config(agent_type)
+    agent = await asyncio.to_thread(agent_service.fetch_agent_config, agent_type)
     if not agent:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -52,7 +53,8 @@ async def get_phone_number_by_agent_type(
             detail="Not authorized to access this agent's phone number"
         )
     
-    phone_number_doc = phone_number.get_phone_number_by_agent_type(
+    phone_number_doc = await asyncio.to_thread(
+        phone_number.get_phone_number_by_agent_type,
         agent_type,
         current_user["org_id"]
     )
@@ -77,7 +79,7 @@ async def attach_phone_number_to_agent(
     """
     # If agent_type is provided, validate that the agent belongs to the user's organization
     if request.agent_type:
-        agent = agent_service.fetch_agent_config(request.agent_type)
+        agent = await asyncio.to_thread(agent_service.fetch_agent_config, request.agent_type)
         if not agent:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -90,7 +92,8 @@ async def attach_phone_number_to_agent(
                 detail="Not authorized to attach phone numbers to this agent"
             )
     
-    result = phone_number.attach_phone_number_to_agent(
+    result = await asyncio.to_thread(
+        phone_number.attach_phone_number_to_agent,
         request.phone_number,
         request.provider,
         request.agent_type,
@@ -119,7 +122,8 @@ async def detach_phone_number(
     """
     Detach a phone number from an agent (protected endpoint).
     """
-    result = phone_number.detach_phone_number(
+    result = await asyncio.to_thread(
+        phone_number.detach_phone_number,
         request.phone_number,
         current_user["org_id"]
     )
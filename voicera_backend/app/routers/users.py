@@ -1,6 +1,7 @@
 """
 User API routes.
 """
+import asyncio
 from fastapi import APIRouter, HTTPException, status, Depends
 from app.models.schemas import (
     UserCreate, UserResponse, UserLogin, UserLoginResponse,
@@ -19,7 +20,8 @@ async def sign_up(user_data: UserCreate):
     Create a new user account (public endpoint).
     Generates a new org_id for the user.
     """
-    result = user_service.sign_up_user(user_data)
+    # bcrypt hashing is deliberately slow; keep it off the event loop
+    result = await asyncio.to_thread(user_service.sign_up_user, user_data)
     if result["status"] == "fail":
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -34,7 +36,9 @@ async def login(credentials: UserLogin):
     Authenticate user and get JWT access token (public endpoint).
     Token expires in 30 minutes.
     """
-    result = user_service.validate_user_and_get_token(
+    # bcrypt verification is deliberately slow; keep it off the event loop
+    result = await asyncio.to_thread(
+        user_service.validate_user_and_get_token,
         credentials.email,
         credentials.password
     )
@@ -51,7 +55,7 @@ async def get_current_user_info(current_user: Dict[str, Any] = Depends(get_curre
     Get current authenticated user's information (protected endpoint).
     Checks both UserTable and Members table.
     """
-    user = user_service.get_user_by_email(current_user["email"])
+    user = await asyncio.to_thread(user_service.get_user_by_email, current_user["email"])
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -72,7 +76,7 @@ async def get_user(email: str, current_user: Dict[str, Any] = Depends(get_curren
             detail="Not authorized to access this user's data"
         )
     
-    user = user_service.get_user_by_email(email)
+    user = await asyncio.to_thread(user_service.get_user_by_email, email)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -86,7 +90,7 @@ async def forgot_password(request: ForgotPasswordRequest):
     Request password reset (public endpoint).
     Sends reset password email via Mailtrap.
     """
-    result = user_service.request_password_reset(request.email)
+    result = await asyncio.to_thread(user_service.request_password_reset, request.email)
     if result["status"] == "fail":
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -99,7 +103,8 @@ async def reset_password(request: ResetPasswordRequest):
     """
     Reset password using reset token (public endpoint).
     """
-    result = user_service.reset_password_with_token(
+    result = await asyncio.to_thread(
+        user_service.reset_password_with_token,
         request.token,
         request.new_password
     )
@@ -1,15 +1,91 @@
 """
 Agent service for handling agent-related database operations.
 """
-from typing import Optional, Dict, Any, List
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
 from app.database import get_database
 from app.models.schemas import AgentConfigCreate, AgentConfigUpdate
 import logging
 import string
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
+# Per-process TTL cache for single-agent lookups, keyed by (field, value).
+# Bot calls fetch the same config repeatedly while it rarely changes; any
+# AgentConfig write clears the cache, and the TTL bounds staleness across
+# worker processes.
+AGENT_CACHE_SIZE = 4096
+AGENT_CACHE_TTL_SECS = 15.0
+_agent_cache: "OrderedDict[Tuple[str, str], Tuple[float, Optional[Dict[str, Any]]]]" = OrderedDict()
+_agent_cache_lock = threading.Lock()
+# Bumped by every invalidation; a lookup that started under an older
+# generation may have read a pre-write document and must not cache it
+_agent_cache_generation = 0
+# Lookups currently querying Mongo, so concurrent misses on one key share
+# a single find_one instead of each issuing their own
+_agent_inflight: Dict[Tuple[str, str], Future] = {}
+
+
+def invalidate_agent_cache() -> None:
+    """Drop all cached agent lookups; call after any AgentConfig write."""
+    global _agent_cache_generation
+    with _agent_cache_lock:
+        _agent_cache.clear()
+        _agent_cache_generation += 1
+        # In-flight queries may predate the write; later callers start fresh
+        _agent_inflight.clear()
+
+
+def _find_agent_cached(field: str, value: str) -> Optional[Dict[str, Any]]:
+    """AgentConfig.find_one({field: value}), memoized for AGENT_CACHE_TTL_SECS."""
+    cache_key = (field, value)
+    now = time.monotonic()
+    
+    with _agent_cache_lock:
+        entry = _agent_cache.get(cache_key)
+        if entry is not None and entry[0] > now:
+            _agent_cache.move_to_end(cache_key)
+            agent = entry[1]
+            # Shallow copy so callers can't mutate the cached document
+            return dict(agent) if agent is not None else None
+        inflight = _agent_inflight.get(cache_key)
+        if inflight is None:
+            inflight = _agent_inflight[cache_key] = Future()
+            generation = _agent_cache_generation
+            leader = True
+        else:
+            leader = False
+    
+    if not leader:
+        # Re-raises the leader's error, which fetch_* callers already handle
+        agent = inflight.result()
+        return dict(agent) if agent is not None else None
+    
+    try:
+        db = get_database()
+        agent = db["AgentConfig"].find_one({field: value})
+        
+        with _agent_cache_lock:
+            # A write landed while we queried; serve the result but don't cache it
+            if generation == _agent_cache_generation:
+                _agent_cache[cache_key] = (now + AGENT_CACHE_TTL_SECS, agent)
+                _agent_cache.move_to_end(cache_key)
+                if len(_agent_cache) > AGENT_CACHE_SIZE:
+                    _agent_cache.popitem(last=False)
+        inflight.set_result(agent)
+    except BaseException as e:
+        inflight.set_exception(e)
+        raise
+    finally:
+        with _agent_cache_lock:
+            if _agent_inflight.get(cache_key) is inflight:
+                del _agent_inflight[cache_key]
+    return dict(agent) if agent is not None else None
+
 def create_agent(agent_data: AgentConfigCreate) -> Dict[str, Any]:
     """
     Create a new agent type for a given org.
@@ -68,6 +144,7 @@ def create_agent(agent_data: AgentConfigCreate) -> Dict[str, Any]:
             agent_doc["vobiz_answer_url"] = agent_data.vobiz_answer_url
         
         agent_table.insert_one(agent_doc)
+        invalidate_agent_cache()
         logger.info(f"Agent created successfully: {agent_data.agent_type}")
         return {"status": "success", "message": "Agent type created successfully"}
         
@@ -86,10 +163,7 @@ def fetch_agent_config(agent_type: str) -> Optional[Dict[str, Any]]:
         Agent config document or None
     """
     try:
-        db = get_database()
-        agent_table = db["AgentConfig"]
-        agent = agent_table.find_one({"agent_type": agent_type})
-        return agent
+        return _find_agent_cached("agent_type", agent_type)
     except Exception as e:
         logger.error(f"Error fetching agent config: {str(e)}")
         return None
@@ -105,10 +179,7 @@ def fetch_agent_config_by_id(agent_id: str) -> Optional[Dict[str, Any]]:
         Agent config document or None
     """
     try:
-        db = get_database()
-        agent_table = db["AgentConfig"]
-        agent = agent_table.find_one({"agent_id": agent_id})
-        return agent
+        return _find_agent_cached("agent_id", agent_id)
     except Exception as e:
         logger.error(f"Error fetching agent config by ID: {str(e)}")
         return None
@@ -132,16 +203,28 @@ def fetch_agents_of_org(org_id: str) -> List[Dict[str, Any]]:
         logger.error(f"Error fetching agents: {str(e)}")
         return []
 
-def update_agent_config(agent_type: str, agent_data: AgentConfigUpdate) -> Dict[str, Any]:
+def _scoped_miss(agent_table, agent_type: str, action: str) -> Dict[str, Any]:
+    """
+    Explain why an org-scoped write matched nothing.
+    
+    Only runs on the failure path, so successful writes stay a single round-trip.
+    """
+    if agent_table.find_one({"agent_type": agent_type}, {"_id": 1}):
+        return {"status": "fail", "message": f"Not authorized to {action} this agent", "error": "forbidden"}
+    return {"status": "fail", "message": "Agent type not found", "error": "not_found"}
+
+def update_agent_config(agent_type: str, agent_data: AgentConfigUpdate, org_id: Optional[str] = None) -> Dict[str, Any]:
     """
     Update agent config.
     
     Args:
         agent_type: Agent type identifier
         agent_data: Updated agent data
+        org_id: If given, only update the agent when it belongs to this org
         
     Returns:
-        Dict with status and message
+        Dict with status and message; scoped misses carry an "error" of
+        "not_found" or "forbidden"
     """
     try:
         db = get_database()
@@ -170,12 +253,20 @@ def update_agent_config(agent_type: str, agent_data: AgentConfigUpdate) -> Dict[
         if agent_data.vobiz_answer_url:
             update_doc["vobiz_answer_url"] = agent_data.vobiz_answer_url
         
+        # Ownership is enforced by the filter itself instead of a pre-read
+        query = {"agent_type": agent_type}
+        if org_id is not None:
+            query["org_id"] = org_id
+        
         result = agent_table.update_one(
-            {"agent_type": agent_type},
+            query,
             {"$set": update_doc}
         )
+        invalidate_agent_cache()
         
         if result.matched_count == 0:
+            if org_id is not None:
+                return _scoped_miss(agent_table, agent_type, "update")
             return {"status": "fail", "message": "Agent type not found"}
         
         logger.info(f"Agent updated successfully: {agent_type}")
@@ -185,23 +276,32 @@ def update_agent_config(agent_type: str, agent_data: AgentConfigUpdate) -> Dict[
         logger.error(f"Error updating agent: {str(e)}")
         return {"status": "fail", "message": f"Error updating agent: {str(e)}"}
 
-def delete_agent(agent_type: str) -> Dict[str, Any]:
+def delete_agent(agent_type: str, org_id: Optional[str] = None) -> Dict[str, Any]:
     """
     Delete an agent by agent_type.
     
     Args:
         agent_type: Agent type identifier
+        org_id: If given, only delete the agent when it belongs to this org
         
     Returns:
-        Dict with status and message
+        Dict with status and message; scoped misses carry an "error" of
+        "not_found" or "forbidden"
     """
     try:
         db = get_database()
         agent_table = db["AgentConfig"]
         
-        result = agent_table.delete_one({"agent_type": agent_type})
+        query = {"agent_type": agent_type}
+        if org_id is not None:
+            query["org_id"] = org_id
+        
+        result = agent_table.delete_one(query)
+        invalidate_agent_cache()
         
         if result.deleted_count == 0:
+            if org_id is not None:
+                return _scoped_miss(agent_table, agent_type, "delete")
             return {"status": "fail", "message": "Agent type not found"}
         
         logger.info(f"Agent deleted successfully: {agent_type}")
@@ -222,10 +322,7 @@ def fetch_agent_by_phone_number(phone_number: str) -> Optional[Dict[str, Any]]:
         Agent config document or None
     """
     try:
-        db = get_database()
-        agent_table = db["AgentConfig"]
-        agent = agent_table.find_one({"phone_number": phone_number})
-        return agent
+        return _find_agent_cached("phone_number", phone_number)
     except Exception as e:
         logger.error(f"Error fetching agent by phone number: {str(e)}")
         return None
@@ -1,7 +1,6 @@
 """
 Email service for sending emails using Mailtrap.
 """
-from mailtrap import Mail, Address, MailtrapClient
 from app.config import settings
 import logging
 
@@ -24,6 +23,9 @@ def send_password_reset_email(email: str, reset_token: str, reset_url: str) -> b
             logger.error("MAILTRAP_API_TOKEN not configured")
             return False
         
+        # Imported on first use: only the forgot-password flow needs the SDK
+        from mailtrap import Mail, Address, MailtrapClient
+        
         mail = Mail(
             sender=Address(email=settings.MAILTRAP_FROM_EMAIL, name=settings.MAILTRAP_FROM_NAME),
             to=[Address(email=email)],
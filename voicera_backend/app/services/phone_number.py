@@ -65,6 +65,7 @@ def attach_phone_number_to_agent(phone_number: str, provider: str, agent_type: O
                 {"agent_type": agent_type},
                 {"$set": {"phone_number": phone_number, "updated_at": datetime.now().isoformat()}}
             )
+            agent_service.invalidate_agent_cache()
         elif not org_id:
             return {"status": "fail", "message": "Either agent_type or org_id must be provided"}
         
@@ -185,6 +186,7 @@ def detach_phone_number(phone_number: str, org_id: str) -> Dict[str, Any]:
                 {"agent_type": agent_type},
                 {"$unset": {"phone_number": ""}, "$set": {"updated_at": current_time}}
             )
+            agent_service.invalidate_agent_cache()
         
         if result.modified_count > 0:
             logger.info(f"Phone number {phone_number} detached from agent")